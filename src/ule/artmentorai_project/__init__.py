@@ -14,8 +14,22 @@ This package serves as a starting point for building a scalable and
 well-organized API, separating infrastructure, business logic, data
 representation, and request handling into clear, maintainable layers.
 """
-from .__version__ import __version__
 
 __all__ = [
     '__version__',
 ]
+
+
+def __getattr__(name: str) -> str:
+    """Resolve `__version__` lazily, so importing the package skips the metadata lookup."""
+    if name == '__version__':
+        import importlib  # noqa: PLC0415
+
+        # The version lives in `_version`: a `__version__` submodule would be bound as
+        # this attribute once imported, shadowing the version string
+        version: str = importlib.import_module(f'{__name__}._version').__version__
+        globals()['__version__'] = version
+        return version
+
+    msg = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(msg)
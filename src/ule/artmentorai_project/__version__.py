@@ -1,6 +0,0 @@
-import importlib.metadata
-
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError:
-    __version__ = '0.1.0'  # Fallback for development mode
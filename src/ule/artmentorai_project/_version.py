@@ -0,0 +1,26 @@
+"""Package version, resolved lazily from the installed distribution metadata."""
+
+_DISTRIBUTION_NAME = 'ULE_artmentorai_project'
+_FALLBACK_VERSION = '0.1.0'  # Fallback for development mode
+
+
+def __getattr__(name: str) -> str:
+    """
+    Resolve `__version__` on first access (PEP 562).
+
+    Reading the distribution metadata scans `sys.path`, so it is only done when
+    the version is actually requested. The result is cached in the module globals.
+    """
+    if name == '__version__':
+        import importlib.metadata  # noqa: PLC0415
+
+        try:
+            version = importlib.metadata.version(_DISTRIBUTION_NAME)
+        except importlib.metadata.PackageNotFoundError:
+            version = _FALLBACK_VERSION
+
+        globals()['__version__'] = version
+        return version
+
+    msg = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(msg)
@@ -1,26 +1,59 @@
-"""Command-line interface for ArtMentor AI."""
+"""Command-line interface for ArtMentor AI.
+
+Heavy dependencies (FastAPI, uvicorn, pydantic settings, the AI services) are
+imported inside the functions that need them, so `--help` and early error
+paths do not pay their import cost.
+"""
+
+from __future__ import annotations
 
-import argparse
 import logging
+import os
 import sys
+from contextlib import AsyncExitStack, asynccontextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-import uvicorn
-from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
-from starlette.middleware.cors import CORSMiddleware
-
-from .config import AppConfig
-from .endpoints import create_analysis_router
 from .exceptions import UserExceptionError
-from .utils import configure_ssl
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from fastapi import FastAPI, Response
+
+    from .config import AppConfig
+
+# Import string used by uvicorn to build the app in each worker process
+_APP_FACTORY = 'ule.artmentorai_project.cli:app_factory'
+
+# Propagates the --verbose flag to worker processes
+_VERBOSE_ENV = 'ARTMENTOR_VERBOSE'
+
+_USAGE = 'usage: artmentor [-h] [--dev] [--verbose] [--workers N]\n'
+_HELP = f"""{_USAGE}
+ArtMentor AI - Intelligent artwork analysis server
+
+options:
+  -h, --help   show this help message and exit
+  --dev        Run in development mode (load vars from .env file)
+  --verbose    Enable verbose (DEBUG) logging
+  --workers N  Number of worker processes (overrides SERVER__WORKERS)
+"""
+_KNOWN_FLAGS = frozenset({'-h', '--help', '--dev', '--verbose'})
+_WORKERS_FLAG = '--workers'
+
+# Room left in request bodies for the multipart framing and form fields around the file
+_MULTIPART_OVERHEAD = 64 * 1024
+
+_LOG_FORMATTER = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
 
 
 def create_app(config: AppConfig) -> FastAPI:
     """
     Create and configure the FastAPI application.
 
-    Initializes all routes, middleware, and services.
+    Initializes all routes and middleware. Services are created by the
+    application lifespan, once per worker process.
 
     Args:
         config: Application configuration object
@@ -28,74 +61,128 @@ def create_app(config: AppConfig) -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    import orjson
+    from fastapi import FastAPI, Response
+    from fastapi.responses import ORJSONResponse
+
+    from .core import ContentLengthLimit, FastCORS, HTTPSRedirect, get_logger
+    from .endpoints import create_analysis_router
+    from .services import AgentService, VectorService, build_gemini_client
+
+    logger = get_logger()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Build shared clients once per worker and warm them up before serving."""
+        # Each cleanup is registered as soon as its resource exists, so a failed
+        # startup still releases whatever was set up, in reverse order
+        async with AsyncExitStack() as cleanup:
+            gemini = build_gemini_client(config.gemini, config.ssl_context, logger)
+            cleanup.push_async_callback(gemini.aclose)
+            app.state.gemini = gemini
+            app.state.agent_service = AgentService(config, gemini)
+
+            vector_service = VectorService(host='localhost', port=6333, logger=logger)
+            cleanup.push_async_callback(vector_service.close)
+            app.state.vector_service = vector_service
+
+            cleanup.push_async_callback(vector_service.stop)
+            await vector_service.start()
+            await gemini.warmup()
+
+            yield
+
+    # The OpenAPI schema and docs UIs are not served in production
+    docs_enabled = config.environment != 'production'
+    docs_url = '/docs' if docs_enabled else None
+    redoc_url = '/redoc' if docs_enabled else None
+
     app = FastAPI(
         title=config.app_name,
         description='Intelligent assistant for artwork analysis and critique using AI',
         version=config.app_version,
         debug=config.debug,
-        docs_url='/docs',
-        redoc_url='/redoc',
+        default_response_class=ORJSONResponse,
+        openapi_url='/openapi.json' if docs_enabled else None,
+        docs_url=docs_url,
+        redoc_url=redoc_url,
+        lifespan=lifespan,
     )
 
     # ============== Include Routers ==============
-    config.logger.info('Registering endpoints')
+    logger.info('Registering endpoints')
 
     # Analysis endpoint (includes critique and health checks)
     analysis_router = create_analysis_router(config)
     app.include_router(analysis_router)
 
-    config.logger.debug('Analysis router registered at /analysis')
+    logger.debug('Analysis router registered at /analysis')
 
     # ============== Add Middleware ==============
-    config.logger.info('Configuring middleware')
+    logger.info('Configuring middleware')
 
-    # Add HTTP to HTTPS redirect if SSL is configured
-    if config.ssl.cert is not None and config.ssl.key is not None:
-        app.add_middleware(HTTPSRedirectMiddleware)
-        config.logger.info('HTTPS redirect middleware enabled')
+    # Middleware added last runs first. Order, from outermost to innermost:
+    #   FastCORS -> HTTPSRedirect -> ContentLengthLimit -> routes
+    # CORS must stay outermost so preflight (OPTIONS) requests are answered
+    # before reaching the HTTPS redirect or the router.
 
-    # Add CORS middleware
+    # Innermost: reject oversized uploads from their Content-Length header,
+    # before the multipart body is read and spooled
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=config.allowed_origins,
-        allow_credentials=True,
-        allow_methods=['*'],
-        allow_headers=['*'],
+        ContentLengthLimit,
+        max_body_size=config.upload.max_file_size_bytes + _MULTIPART_OVERHEAD,
+        detail=config.upload.file_size_error,
     )
-    config.logger.debug(
+
+    # Add HTTP to HTTPS redirect if SSL is configured
+    if config.ssl.cert is not None and config.ssl.key is not None:
+        app.add_middleware(HTTPSRedirect)
+        logger.info('HTTPS redirect middleware enabled')
+
+    # Add CORS middleware (outermost, keep it last)
+    app.add_middleware(FastCORS, origins=config.allowed_origins_set)
+    logger.debug(
         'CORS middleware configured for origins: %s',
         ', '.join(config.allowed_origins),
     )
 
     # ============== Root Endpoints ==============
-    @app.get('/', tags=['General'])
-    async def root() -> dict:
-        """Root endpoint with API information."""
-        return {
+    # Both payloads are static: serialize them once instead of on every request
+    root_body = orjson.dumps(
+        {
             'name': config.app_name,
             'version': config.app_version,
             'environment': config.environment,
             'status': 'running',
-            'docs': '/docs',
-            'redoc': '/redoc',
+            'docs': docs_url,
+            'redoc': redoc_url,
             'endpoints': {
                 'critique': 'POST /analysis/critique',
                 'analysis_health': 'GET /analysis/health',
                 'vector_db_health': 'GET /analysis/vector-db-health',
             },
         }
-
-    @app.get('/health', tags=['General'])
-    async def health() -> dict:
-        """Global health check for the application."""
-        return {
+    )
+    health_body = orjson.dumps(
+        {
             'status': 'healthy',
             'app': config.app_name,
             'version': config.app_version,
             'environment': config.environment,
         }
+    )
+
+    @app.get('/', tags=['General'], response_model=None)
+    async def root() -> Response:
+        """Root endpoint with API information."""
+        return Response(content=root_body, media_type='application/json')
+
+    @app.get('/health', tags=['General'], response_model=None)
+    async def health() -> Response:
+        """Global health check for the application."""
+        return Response(content=health_body, media_type='application/json')
 
-    config.logger.info('Application endpoints registered successfully')
+    logger.info('Application endpoints registered successfully')
 
     return app
 
@@ -110,97 +197,182 @@ def _setup_logger(verbose: bool) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance.
     """
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s | %(levelname)s | %(message)s',
-        stream=sys.stdout,
-    )
+    # The format never uses thread/process/task info: skip collecting it per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if sys.version_info >= (3, 12):
+        logging.logAsyncioTasks = False
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    # Same behavior as logging.basicConfig(): only add a handler if none exists
+    if not root_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_LOG_FORMATTER)
+        root_logger.addHandler(handler)
+
     return logging.getLogger(__name__)
 
 
-def _parse_args() -> argparse.Namespace:
+def _load_config(logger: logging.Logger) -> AppConfig:
     """
-    Parse command line arguments.
+    Load and validate the application configuration.
+
+    Args:
+        logger: Logger instance
 
     Returns:
-        argparse.Namespace: Parsed arguments
+        AppConfig: Validated configuration with the logger attached
+
+    Raises:
+        UserExceptionError: If configuration fails
     """
-    parser = argparse.ArgumentParser(
-        description='ArtMentor AI - Intelligent artwork analysis server',
-        prog='artmentor',
-    )
+    from .config import AppConfig
 
-    parser.add_argument(
-        '--dev',
-        action='store_true',
-        help='Run in development mode (load vars from .env file)',
-    )
+    try:
+        config = AppConfig()
+        config.set_logger(logger)
+    except Exception as e:
+        msg = f'Failed to load configuration: {e!s}'
+        raise UserExceptionError(
+            msg,
+            exit_code=1,
+        ) from e
 
-    parser.add_argument(
-        '--verbose',
-        action='store_true',
-        help='Enable verbose (DEBUG) logging',
-    )
+    return config
+
+
+def app_factory() -> FastAPI:
+    """
+    Build the application inside a uvicorn worker process.
+
+    Used when the server runs with several workers or with auto-reload, where
+    uvicorn needs an import string instead of an application object.
+
+    Returns:
+        FastAPI: Configured FastAPI application instance
+    """
+    from .utils import configure_ssl
+
+    logger = _setup_logger(verbose=os.environ.get(_VERBOSE_ENV) == '1')
+    config = _load_config(logger)
+    configure_ssl(config)
+    return create_app(config)
+
+
+def _parse_args() -> SimpleNamespace:
+    """
+    Parse command line arguments.
+
+    The CLI only takes a handful of flags, so `sys.argv` is scanned directly
+    instead of building an `argparse` parser, which keeps argparse out of the
+    startup path.
 
-    return parser.parse_args()
+    Returns:
+        SimpleNamespace: Parsed arguments (`dev`, `verbose`, `help`, `workers`, `unknown`).
+            `workers` is None when the flag is absent.
+    """
+    args = SimpleNamespace(dev=False, verbose=False, help=False, workers=None, unknown=[])
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg in _KNOWN_FLAGS:
+            if arg == '--dev':
+                args.dev = True
+            elif arg == '--verbose':
+                args.verbose = True
+            else:
+                args.help = True
+            continue
+
+        name, sep, value = arg.partition('=')
+        if name != _WORKERS_FLAG:
+            args.unknown.append(arg)
+            continue
+        if not sep:
+            value = next(argv, '')
+        if value.isdecimal() and int(value) > 0:
+            args.workers = int(value)
+        else:
+            args.unknown.append(f'{_WORKERS_FLAG} {value}'.rstrip())
+    return args
 
 
-def _run_server(logger: logging.Logger, dev: bool = False) -> None:
+def _run_server(logger: logging.Logger, dev: bool = False, workers: int | None = None) -> None:
     """
     Run the server.
 
     Args:
         logger: Logger instance
         dev: Development mode. Used to read vars from `.env` file. Defaults to False.
+        workers: Number of worker processes. Defaults to the `server.workers` setting.
+            Ignored when auto-reload is enabled.
 
     Raises:
         UserExceptionError: If configuration fails
     """
+    import uvicorn
+
+    from .utils import configure_ssl
+
     if dev:
+        from dotenv import load_dotenv
+
         load_dotenv(override=True)
         logger.info('Loaded environment variables from .env file')
 
     # Load and validate configuration
-    try:
-        config = AppConfig()
-        config.set_logger(logger)
-    except Exception as e:
-        msg = f'Failed to load configuration: {e!s}'
-        raise UserExceptionError(
-            msg,
-            exit_code=1,
-        ) from e
+    config = _load_config(logger)
 
     # Configure SSL
     configure_ssl(config)
 
-    # Create FastAPI app with all endpoints
-    app = create_app(config)
+    # Multiple workers and auto-reload both need an import string: each worker
+    # process builds its own app through `app_factory`
+    if config.server.reload:
+        workers = 1
+    elif workers is None:
+        workers = config.server.workers
+    use_factory = workers > 1 or config.server.reload
+    if use_factory:
+        os.environ[_VERBOSE_ENV] = '1' if logger.isEnabledFor(logging.DEBUG) else '0'
+        app: FastAPI | str = _APP_FACTORY
+    else:
+        # Create FastAPI app with all endpoints
+        app = create_app(config)
 
     # Run server
     logger.info(
-        'Starting %s on %s:%s (environment: %s)',
+        'Starting %s on %s:%s with %d worker(s) (environment: %s)',
         config.app_name,
         config.server.host,
         config.server.port,
+        workers,
         config.environment,
     )
-    logger.info(
-        'API Documentation available at http://%s:%s/docs',
-        config.server.host,
-        config.server.port,
-    )
+    if config.environment != 'production':
+        logger.info(
+            'API Documentation available at http://%s:%s/docs',
+            config.server.host,
+            config.server.port,
+        )
 
     uvicorn.run(
         app,
+        factory=use_factory,
         host=config.server.host,
         port=config.server.port,
         ssl_keyfile=str(config.ssl.key) if config.ssl.key else None,
         ssl_certfile=str(config.ssl.cert) if config.ssl.cert else None,
         ssl_ca_certs=str(config.ssl.ca) if config.ssl.ca else None,
         reload=config.server.reload,
+        workers=workers,
+        loop='uvloop' if sys.platform != 'win32' else 'auto',
+        http='httptools',
         log_level='debug' if config.debug else 'info',
+        # Per-request access logging is only worth its cost while debugging
+        access_log=config.debug,
     )
 
 
@@ -214,10 +386,19 @@ def main() -> int:
             - Non-zero if an error occurred.
     """
     args = _parse_args()
+    if args.help:
+        sys.stdout.write(_HELP)
+        return 0
+    if args.unknown:
+        sys.stderr.write(
+            f'{_USAGE}artmentor: error: unrecognized arguments: {" ".join(args.unknown)}\n'
+        )
+        return 2
+
     logger = _setup_logger(args.verbose)
 
     try:
-        _run_server(logger, dev=args.dev)
+        _run_server(logger, dev=args.dev, workers=args.workers)
     except UserExceptionError as e:
         logger.exception('Error: %s', e.message)
         return e.exit_code
@@ -1,18 +1,20 @@
 """Application configuration container for ArtMentor AI."""
 
 import logging
-from typing import Protocol, runtime_checkable
+from functools import cached_property
+from ssl import SSLContext
+from typing import ClassVar, Protocol
 
-from pydantic import ConfigDict, Field, PrivateAttr
+from pydantic import ConfigDict, Field
 from pydantic_settings import BaseSettings
 
+from ..core.logger import set_logger
 from .gemini_config import GeminiConfig
 from .server_config import ServerConfig
 from .ssl_config import SSLConfig
 from .upload_config import UploadConfig
 
 
-@runtime_checkable
 class _SetupProtocol(Protocol):
     """Protocol for configurations that need logger setup."""
 
@@ -30,6 +32,7 @@ class AppConfig(BaseSettings):
 
     model_config = ConfigDict(
         frozen=True,
+        validate_assignment=False,
         env_file='.env',
         env_file_encoding='utf-8',
         case_sensitive=False,
@@ -59,15 +62,16 @@ class AppConfig(BaseSettings):
         default_factory=UploadConfig, description='File upload configuration'
     )
 
-    # ============== Private Logger ==============
-    _logger: logging.Logger | None = PrivateAttr(default=None)
+    # Sub-configurations implementing _SetupProtocol, in setup order
+    _SETUP_FIELDS: ClassVar[tuple[str, ...]] = ('server', 'ssl', 'gemini', 'upload')
 
     def set_logger(self, logger: logging.Logger) -> None:
         """
         Assigns the externally created logger instance.
 
-        This method propagates the logger to all sub-configurations
-        that implement the _SetupProtocol interface.
+        The logger is stored application-wide and read with `core.get_logger()`.
+        This method also propagates the logger to all sub-configurations
+        listed in `_SETUP_FIELDS`, which implement the _SetupProtocol interface.
 
         Args:
             logger: The logger instance to use throughout the application
@@ -79,7 +83,7 @@ class AppConfig(BaseSettings):
             msg = 'Logger instance cannot be None'
             raise RuntimeError(msg)
 
-        self._logger = logger
+        set_logger(logger)
 
         # Log application startup info
         logger.info('%s v%s initializing...', self.app_name, self.app_version)
@@ -87,25 +91,32 @@ class AppConfig(BaseSettings):
         logger.info('Debug mode: %s', self.debug)
 
         # Propagate logger to sub-configurations with setup() method
-        for attr_name, attr_value in self.__dict__.items():
-            if isinstance(attr_value, _SetupProtocol):
-                logger.debug('Setting up sub-config: %s', attr_name)
-                attr_value.setup(logger)
+        for attr_name in self._SETUP_FIELDS:
+            sub_config: _SetupProtocol = getattr(self, attr_name)
+            logger.debug('Setting up sub-config: %s', attr_name)
+            sub_config.setup(logger)
 
-    @property
-    def logger(self) -> logging.Logger:
+    @cached_property
+    def allowed_origins_set(self) -> frozenset[bytes]:
         """
-        Returns the logger instance.
+        Returns the CORS allowed origins, encoded as in ASGI headers.
 
-        Must be initialized first via set_logger().
+        Lets the CORS middleware check the raw `Origin` header with a single
+        hash lookup, without decoding it or scanning the origins list.
 
         Returns:
-            logging.Logger: The configured logger instance
+            frozenset[bytes]: Allowed origins encoded as latin-1
+        """
+        return frozenset(origin.encode('latin-1') for origin in self.allowed_origins)
 
-        Raises:
-            RuntimeError: If logger not initialized
+    @property
+    def ssl_context(self) -> SSLContext:
         """
-        if self._logger is None:
-            msg = 'Logger not initialized: call config.set_logger(...) first'
-            raise RuntimeError(msg)
-        return self._logger
+        Returns the SSL context for outbound TLS connections.
+
+        The context is shared process-wide (see `SSLConfig.build_ssl_context`).
+
+        Returns:
+            SSLContext: The shared client-side SSL context
+        """
+        return self.ssl.build_ssl_context()
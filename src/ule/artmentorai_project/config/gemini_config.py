@@ -9,7 +9,7 @@ from pydantic_settings import BaseSettings
 class GeminiConfig(BaseSettings):
     """Configuration for Google Gemini AI service."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
 
     api_key: str = Field(
         ..., description='Google Gemini API Key', json_schema_extra={'env': 'GEMINI_API_KEY'}
@@ -1,6 +1,7 @@
 """Server configuration."""
 
 import logging
+import os
 
 from pydantic import ConfigDict, Field
 from pydantic_settings import BaseSettings
@@ -9,13 +10,20 @@ from pydantic_settings import BaseSettings
 class ServerConfig(BaseSettings):
     """Server configuration for FastAPI."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
 
     host: str = Field(default='127.0.0.1', description='Server host address')
     port: int = Field(default=8000, description='Server port number')
     reload: bool = Field(
         default=False, description='Auto-reload on code changes (development only)'
     )
+    # Each worker loads its own embedding model, whose ONNX session already uses
+    # every core: one worker per core avoids oversubscribing the CPU
+    workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        ge=1,
+        description='Number of worker processes (ignored when auto-reload is enabled)',
+    )
 
     def setup(self, logger: logging.Logger) -> None:
         """
@@ -25,5 +33,6 @@ class ServerConfig(BaseSettings):
             logger: Logger instance for logging setup info
         """
         logger.info('Server configured: %s:%s', self.host, self.port)
+        logger.debug('Server workers: %s', self.workers)
         if self.reload:
             logger.warning('Auto-reload enabled (development mode)')
@@ -1,20 +1,36 @@
+import functools
 import logging
-import os
-import shutil
-import sys
-from collections.abc import Generator
-from contextlib import AbstractContextManager, contextmanager
-from pathlib import Path
+import ssl
 
 import certifi
 from pydantic import FilePath
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_ssl_context(ca_path: str | None) -> ssl.SSLContext:
+    """
+    Build the process-wide client SSL context.
+
+    Cached so the certifi bundle and the custom CA are parsed only once per
+    process, whatever the number of clients using the context.
+
+    Args:
+        ca_path: Path to an extra CA bundle to trust, if any
+
+    Returns:
+        ssl.SSLContext: Client-side SSL context
+    """
+    context = ssl.create_default_context(cafile=certifi.where())
+    if ca_path is not None:
+        context.load_verify_locations(cafile=ca_path)
+    return context
+
+
 class SSLConfig(BaseSettings):
     """SSL configuration for the server."""
 
-    model_config = SettingsConfigDict(env_prefix='SERVER_SSL_')
+    model_config = SettingsConfigDict(env_prefix='SERVER_SSL_', validate_assignment=False)
 
     cert: FilePath | None = None
     """Path to the SSL certificate file."""
@@ -27,58 +43,32 @@ class SSLConfig(BaseSettings):
 
     def setup(self, logger: logging.Logger) -> None:
         """
-        Set up SSL certificates by adding a custom CA bundle to certifi's store if SSL is enabled.
+        Check the custom CA bundle used for outbound TLS connections.
 
-        This function checks if SSL is enabled and if a custom CA bundle path is provided.
-        If so, it backs up the current certifi CA store, appends the custom CA bundle to it,
-        and sets the SSL_CERT_FILE environment variable to point to the updated store.
+        The CA bundle is only trusted when SSL is enabled (both key and cert are set).
+        It is loaded in memory by `build_ssl_context`; neither the certifi store nor
+        the process environment are modified. File existence is already enforced by
+        the `FilePath` fields, so no filesystem access happens here.
         """
-        if not sys.platform.startswith('linux'):
-            logger.info('Skipping SSL configuration: is only applicable on Linux platforms')
-            return
-
         if not (self.key and self.cert):
             return
 
-        if not (self.ca and self.ca.is_file()):
-            logger.warning('SSL is enabled but no CA bundle provided or file not found')
+        if self.ca is None:
+            logger.warning('SSL is enabled but no CA bundle provided')
             return
 
-        try:
-            with self._manage_certifi_backup() as certifi_path:
-                self.__append_custom_ca_to_certifi(self.ca, certifi_path)
-        except (
-            FileNotFoundError,
-            PermissionError,
-        ):  # pragma: no cover # This shouldn't be reachable
-            logger.error('Failed to add custom CA bundle to certifi store')  # noqa: TRY400
-            return
+        logger.info('Custom CA bundle will be trusted for outbound connections')
+
+    def build_ssl_context(self) -> ssl.SSLContext:
+        """
+        Build the SSL context used to verify outbound TLS connections.
+
+        The context trusts certifi's CA store plus the custom CA bundle when SSL is
+        enabled. It is built once per process and shared by every caller, so
+        OpenSSL parses the certificates a single time.
 
-        os.environ['SSL_CERT_FILE'] = str(certifi_path)
-        logger.info('Successfully added custom CA bundle to certifi store')
-
-    @classmethod
-    def _manage_certifi_backup(cls) -> AbstractContextManager[Path]:
-        @contextmanager
-        def _context() -> Generator[Path, None, None]:
-            certifi_path = Path(certifi.where())
-            backup_path = Path(f'{certifi_path}.backup')
-
-            if not backup_path.exists():
-                shutil.copy2(certifi_path, backup_path)
-
-            try:
-                yield certifi_path
-            except Exception:  # pragma: no cover
-                if backup_path.exists():
-                    shutil.copy2(backup_path, certifi_path)
-                raise
-
-        return _context()
-
-    @classmethod
-    def __append_custom_ca_to_certifi(cls, ca_path: Path, certifi_path: Path) -> None:
-        """Append custom CA bundle to the certifi CA store."""
-        with ca_path.open('rb') as custom_ca, certifi_path.open('ab') as certifi_ca:
-            certifi_ca.write(b'\n')
-            certifi_ca.write(custom_ca.read())
+        Returns:
+            ssl.SSLContext: Client-side SSL context
+        """
+        ca_path = str(self.ca) if self.key and self.cert and self.ca else None
+        return _shared_ssl_context(ca_path)
@@ -1,6 +1,7 @@
 """File upload configuration."""
 
 import logging
+from functools import cached_property
 from pathlib import Path
 
 from pydantic import ConfigDict, Field
@@ -10,9 +11,22 @@ from pydantic_settings import BaseSettings
 class UploadConfig(BaseSettings):
     """Configuration for file uploads."""
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
 
     max_file_size_mb: int = Field(default=10, description='Maximum upload file size in MB')
+    pool_size: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            'Maximum number of analyses run at once per worker. Each one holds a '
+            'pre-allocated upload buffer of `max_file_size_mb` until Gemini answers'
+        ),
+    )
+    pool_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description='Maximum wait for a free analysis slot (upload buffer) before answering 503',
+    )
     upload_dir: Path = Field(default=Path('./uploads'), description='Directory for uploaded files')
     allowed_extensions: list[str] = Field(
         default=['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'],
@@ -22,6 +36,73 @@ class UploadConfig(BaseSettings):
         default=['image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/bmp'],
         description='Allowed MIME types',
     )
+    extension_mime_types: dict[str, list[str]] = Field(
+        default={
+            '.jpg': ['image/jpeg'],
+            '.jpeg': ['image/jpeg'],
+            '.png': ['image/png'],
+            '.gif': ['image/gif'],
+            '.webp': ['image/webp'],
+            '.bmp': ['image/bmp'],
+        },
+        description='MIME types matching each file extension',
+    )
+
+    @cached_property
+    def max_file_size_bytes(self) -> int:
+        """
+        Returns the maximum upload file size in bytes.
+
+        Returns:
+            int: Maximum upload file size in bytes
+        """
+        return self.max_file_size_mb * 1024 * 1024
+
+    @cached_property
+    def file_size_error(self) -> str:
+        """
+        Returns the error message for uploads exceeding the maximum file size.
+
+        Returns:
+            str: Error message with the maximum file size
+        """
+        return f'File too large (max {self.max_file_size_mb}MB)'
+
+    @cached_property
+    def mime_types_by_extension(self) -> dict[str, tuple[str, ...]]:
+        """
+        Returns the accepted MIME types of each allowed extension.
+
+        Only extensions in `allowed_extensions` and MIME types in `allowed_mime_types`
+        are kept, so a single lookup validates both. The first MIME type of each
+        extension is used when the upload has no content type.
+
+        Returns:
+            dict[str, tuple[str, ...]]: Accepted MIME types by file extension
+        """
+        allowed_mime_types = frozenset(self.allowed_mime_types)
+        table = {
+            extension: tuple(
+                mime_type
+                for mime_type in self.extension_mime_types.get(extension, ())
+                if mime_type in allowed_mime_types
+            )
+            for extension in self.allowed_extensions
+        }
+        return {extension: mime_types for extension, mime_types in table.items() if mime_types}
+
+    @cached_property
+    def file_type_error(self) -> str:
+        """
+        Returns the error message for uploads with a disallowed extension or MIME type.
+
+        Returns:
+            str: Error message listing the allowed extensions and MIME types
+        """
+        return (
+            f'File type not allowed. Use: {", ".join(self.mime_types_by_extension)} '
+            f'({", ".join(self.allowed_mime_types)})'
+        )
 
     def setup(self, logger: logging.Logger) -> None:
         """
@@ -32,6 +113,7 @@ class UploadConfig(BaseSettings):
         """
         logger.info('Upload directory: %s', self.upload_dir)
         logger.info('Max file size: %dMB', self.max_file_size_mb)
+        logger.debug('Concurrent analyses per worker (upload buffers): %d', self.pool_size)
         logger.debug('Allowed extensions: %s', ', '.join(self.allowed_extensions))
 
         # Create the upload directory if it doesn't exist
@@ -10,3 +10,14 @@ Files placed here should define the essential infrastructure that the
 rest of the application depends on, but should remain independent from
 the business logic of specific modules.
 """
+
+from .logger import get_logger, set_logger
+from .middleware import ContentLengthLimit, FastCORS, HTTPSRedirect
+
+__all__ = [
+    'ContentLengthLimit',
+    'FastCORS',
+    'HTTPSRedirect',
+    'get_logger',
+    'set_logger',
+]
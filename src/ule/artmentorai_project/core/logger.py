@@ -0,0 +1,26 @@
+"""Application-wide logger access.
+
+The logger configured by the CLI is stored in a `ContextVar`, so reading it is
+a single C-level lookup and stays safe across threads and asyncio tasks.
+"""
+
+import logging
+from contextvars import ContextVar
+
+# Used by contexts created before `set_logger` runs (e.g. inside uvicorn workers)
+_DEFAULT_LOGGER = logging.getLogger('ule.artmentorai_project')
+
+_logger: ContextVar[logging.Logger] = ContextVar('logger', default=_DEFAULT_LOGGER)
+
+get_logger = _logger.get
+"""Return the application logger."""
+
+
+def set_logger(logger: logging.Logger) -> None:
+    """
+    Set the application logger for the current context.
+
+    Args:
+        logger: The logger instance to use throughout the application
+    """
+    _logger.set(logger)
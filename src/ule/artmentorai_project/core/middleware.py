@@ -0,0 +1,205 @@
+"""Pure ASGI middleware for ArtMentor AI.
+
+``FastCORS`` and ``HTTPSRedirect`` replace Starlette's ``CORSMiddleware`` and
+``HTTPSRedirectMiddleware``. All classes operate directly on the ASGI
+``scope``/``send`` primitives, so every request avoids the extra
+``Request``/``Response`` objects and coroutine layers the Starlette
+implementations create.
+"""
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_METHODS = b'DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT'
+_PREFLIGHT_MAX_AGE = b'600'
+_DISALLOWED_ORIGIN_BODY = b'Disallowed CORS origin'
+_DISALLOWED_ORIGIN_LENGTH = str(len(_DISALLOWED_ORIGIN_BODY)).encode('latin-1')
+
+
+def _get_header(scope: Scope, name: bytes) -> bytes | None:
+    """
+    Return the first value of a (lowercase) request header.
+
+    Args:
+        scope: ASGI connection scope
+        name: Lowercase header name
+
+    Returns:
+        bytes | None: Raw header value, or None if the header is absent
+    """
+    for key, value in scope['headers']:
+        if key == name:
+            return value
+    return None
+
+
+class FastCORS:
+    """
+    CORS middleware allowing all methods and headers, with credentials.
+
+    Behaves like ``CORSMiddleware(allow_methods=['*'], allow_headers=['*'],
+    allow_credentials=True)``: allowed origins are echoed back and preflight
+    requests are answered (``204 No Content``) without reaching the application.
+    Install it as the outermost middleware.
+    """
+
+    def __init__(self, app: ASGIApp, origins: frozenset[bytes]) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            origins: Allowed origins, latin-1 encoded. ``b'*'`` allows any origin.
+        """
+        self.app = app
+        self.allowed = origins
+        self.allow_all = b'*' in origins
+
+        self._preflight_headers = [
+            (b'access-control-allow-methods', _ALLOW_METHODS),
+            (b'access-control-max-age', _PREFLIGHT_MAX_AGE),
+            (b'access-control-allow-credentials', b'true'),
+            (b'vary', b'Origin'),
+        ]
+        self._simple_headers = [
+            (b'access-control-allow-credentials', b'true'),
+            (b'vary', b'Origin'),
+        ]
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self.allow_all or origin in self.allowed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add CORS headers to responses and answer preflight requests."""
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        origin = _get_header(scope, b'origin')
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope['method'] == 'OPTIONS':
+            request_method = _get_header(scope, b'access-control-request-method')
+            if request_method is not None:
+                await self._preflight(scope, origin, send)
+                return
+
+        if not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b'access-control-allow-origin', origin), *self._simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                message['headers'] = [*message.get('headers', ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, scope: Scope, origin: bytes, send: Send) -> None:
+        """Answer a CORS preflight request directly, without a body when allowed."""
+        headers = list(self._preflight_headers)
+
+        request_headers = _get_header(scope, b'access-control-request-headers')
+        if request_headers is not None:
+            headers.append((b'access-control-allow-headers', request_headers))
+
+        if self._is_allowed(origin):
+            headers.append((b'access-control-allow-origin', origin))
+            await send({'type': 'http.response.start', 'status': 204, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        headers.append((b'content-type', b'text/plain; charset=utf-8'))
+        headers.append((b'content-length', _DISALLOWED_ORIGIN_LENGTH))
+        await send({'type': 'http.response.start', 'status': 400, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': _DISALLOWED_ORIGIN_BODY})
+
+
+class HTTPSRedirect:
+    """Redirect plain HTTP requests to HTTPS with a ``307 Temporary Redirect``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Redirect ``http`` requests, pass everything else through."""
+        if scope['type'] != 'http' or scope['scheme'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        host = _get_header(scope, b'host')
+        if host is None:
+            server_host, server_port = scope['server']
+            host = f'{server_host}:{server_port}'.encode('latin-1')
+
+        name, sep, port = host.rpartition(b':')
+        if sep and port in {b'80', b'443'}:
+            host = name
+
+        path = scope.get('raw_path') or scope['path'].encode('utf-8')
+        location = b'https://' + host + path
+        if scope['query_string']:
+            location += b'?' + scope['query_string']
+
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': 307,
+                'headers': [(b'location', location), (b'content-length', b'0')],
+            }
+        )
+        await send({'type': 'http.response.body', 'body': b''})
+
+
+class ContentLengthLimit:
+    """
+    Reject requests declaring a body larger than a limit with ``413 Content Too Large``.
+
+    The check only reads the ``Content-Length`` header, so oversized requests are
+    rejected before any of their body is received or parsed. Bodies sent without
+    that header (chunked) must still be limited while they are read.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int, detail: str) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_body_size: Maximum accepted body size in bytes
+            detail: Error detail of the JSON response, as returned by ``HTTPException``
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+
+        self._body = orjson.dumps({'detail': detail})
+        self._headers = [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(self._body)).encode('latin-1')),
+            (b'connection', b'close'),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer requests with a too large ``Content-Length``, pass everything else through."""
+        if scope['type'] == 'http':
+            content_length = _get_header(scope, b'content-length')
+            if (
+                content_length is not None
+                and content_length.isdigit()
+                and int(content_length) > self.max_body_size
+            ):
+                await send({'type': 'http.response.start', 'status': 413, 'headers': self._headers})
+                await send({'type': 'http.response.body', 'body': self._body})
+                return
+
+        await self.app(scope, receive, send)
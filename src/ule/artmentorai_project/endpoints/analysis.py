@@ -7,38 +7,44 @@ This module provides REST endpoints for:
 - Error handling that doesn't break the API if vector DB is down
 """
 
-from pathlib import Path
+import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Annotated
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from fastapi.responses import ORJSONResponse
 
 from ..config import AppConfig
+from ..core import get_logger
 from ..models import AnalysisResponse
 from ..services import AgentService
 from ..services.vector_service import ArtCritique, VectorService
 
+# Uploads are read in chunks of this size (1 MiB)
+_READ_CHUNK_SIZE = 1024 * 1024
 
-def get_agent_service(config: AppConfig) -> AgentService:
-    """Dependency injection for AgentService."""
-    return AgentService(config)
+# Number of recent analyses kept to answer duplicate uploads
+_RECENT_ANALYSES_SIZE = 512
 
+# Recent analyses are keyed by image digest, MIME type and user comments
+_AnalysisKey = tuple[bytes, str, str | None]
 
-def get_vector_service(config: AppConfig) -> VectorService:
-    """Dependency injection for VectorService.
 
-    Creates or reuses VectorService instance with proper logger.
+def get_agent_service(request: Request) -> AgentService:
+    """Dependency injection for AgentService.
 
-    Args:
-        config: Application configuration
+    The service is built once per worker by the application lifespan.
+    """
+    return request.app.state.agent_service
 
-    Returns:
-        VectorService: Initialized vector service instance
+
+def get_vector_service(request: Request) -> VectorService:
+    """Dependency injection for VectorService.
+
+    The service is built once per worker by the application lifespan.
     """
-    return VectorService(
-        host='localhost',
-        port=6333,
-        logger=config.logger,
-    )
+    return request.app.state.vector_service
 
 
 def _validate_image_file(
@@ -60,53 +66,150 @@ def _validate_image_file(
     Raises:
         HTTPException: If file is not valid
     """
-    file_extension = Path(filename).suffix.lower()
-    actual_mime = content_type or 'image/jpeg'
+    _, sep, suffix = filename.rpartition('.')
+    file_extension = f'.{suffix.lower()}' if sep else ''
 
-    if file_extension not in config.upload.allowed_extensions:
-        allowed = ', '.join(config.upload.allowed_extensions)
+    # One lookup checks the extension, the MIME type and that both match
+    mime_types = config.upload.mime_types_by_extension.get(file_extension)
+    if not mime_types or (content_type and content_type not in mime_types):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f'Extension not allowed. Use: {allowed}',
+            detail=config.upload.file_type_error,
         )
 
-    if actual_mime not in config.upload.allowed_mime_types:
-        allowed = ', '.join(config.upload.allowed_mime_types)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f'MIME type not allowed. Use: {allowed}',
-        )
+    actual_mime = content_type or mime_types[0]
 
     return file_extension, actual_mime
 
 
-def _validate_file_size(
-    content: bytes,
-    max_file_size_mb: int,
-) -> None:
+async def _read_upload(
+    file: UploadFile,
+    buffer: bytearray,
+    size_error: str,
+) -> tuple[int, bytes]:
     """
-    Validate that file size is within limits.
+    Read an uploaded file in chunks into a pre-allocated buffer.
+
+    The size limit is the buffer length and is enforced while reading, so
+    oversized uploads are rejected as soon as the limit is crossed. The content
+    is hashed (BLAKE2b) chunk by chunk, without another pass over the buffer.
+    The digest is collision-resistant, as it keys analyses shared by all users.
 
     Args:
-        content: File content bytes
-        max_file_size_mb: Maximum allowed file size in MB
+        file: Uploaded file
+        buffer: Buffer receiving the file content, sized to the upload limit
+        size_error: Error message returned when the file is too large
+
+    Returns:
+        tuple: (number of bytes written to the buffer, 128-bit digest of the content)
 
     Raises:
         HTTPException: If file is too large or empty
     """
-    max_size = max_file_size_mb * 1024 * 1024
-    if len(content) > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f'File too large (max {max_file_size_mb}MB)',
-        )
+    size = 0
+    max_size = len(buffer)
+    hasher = hashlib.blake2b(digest_size=16)
+    while chunk := await file.read(_READ_CHUNK_SIZE):
+        end = size + len(chunk)
+        if end > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=size_error,
+            )
+        buffer[size:end] = chunk
+        hasher.update(chunk)
+        size = end
 
-    if len(content) == 0:
+    if size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='File is empty',
         )
 
+    return size, hasher.digest()
+
+
+def _create_buffer_pool(size: int, buffer_size: int) -> asyncio.Queue[bytearray]:
+    """
+    Create a pool of pre-allocated upload buffers.
+
+    Args:
+        size: Number of buffers in the pool
+        buffer_size: Size of each buffer in bytes
+
+    Returns:
+        asyncio.Queue[bytearray]: Queue holding the free buffers
+    """
+    pool: asyncio.Queue[bytearray] = asyncio.Queue(maxsize=size)
+    for _ in range(size):
+        pool.put_nowait(bytearray(buffer_size))
+    return pool
+
+
+async def _acquire_buffer(pool: asyncio.Queue[bytearray], wait_seconds: float) -> bytearray:
+    """
+    Take a free upload buffer from the pool, waiting at most `wait_seconds`.
+
+    Args:
+        pool: Queue holding the free buffers
+        wait_seconds: Maximum wait for a free buffer, in seconds
+
+    Returns:
+        bytearray: Buffer to return to the pool once the analysis completes
+
+    Raises:
+        HTTPException: If no buffer was freed in time
+    """
+    try:
+        async with asyncio.timeout(wait_seconds):
+            return await pool.get()
+    except TimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Server busy, please retry later',
+        ) from e
+
+
+class _RecentAnalyses:
+    """Least recently used analyses, keyed by image digest, MIME type and user comments."""
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of analyses kept
+        """
+        self.maxsize = maxsize
+        self._analyses: OrderedDict[_AnalysisKey, AnalysisResponse] = OrderedDict()
+
+    def get(self, key: _AnalysisKey) -> AnalysisResponse | None:
+        """
+        Return a previous analysis and mark it as recently used.
+
+        Args:
+            key: Image digest, MIME type and user comments
+
+        Returns:
+            AnalysisResponse | None: Previous analysis, or None if not cached
+        """
+        analysis = self._analyses.get(key)
+        if analysis is not None:
+            self._analyses.move_to_end(key)
+        return analysis
+
+    def put(self, key: _AnalysisKey, analysis: AnalysisResponse) -> None:
+        """
+        Store an analysis, evicting the least recently used one when full.
+
+        Args:
+            key: Image digest, MIME type and user comments
+            analysis: Analysis of the image
+        """
+        self._analyses[key] = analysis
+        if len(self._analyses) > self.maxsize:
+            self._analyses.popitem(last=False)
+
 
 def create_analysis_router(config: AppConfig) -> APIRouter:
     """
@@ -121,16 +224,27 @@ def create_analysis_router(config: AppConfig) -> APIRouter:
     router = APIRouter(
         prefix='/analysis',
         tags=['Analysis'],
+        default_response_class=ORJSONResponse,
         responses={
             400: {'description': 'Invalid file'},
             413: {'description': 'File too large'},
             500: {'description': 'Server error'},
+            503: {'description': 'Server busy'},
         },
     )
 
-    # Initialize services
-    agent_service = AgentService(config)
-    vector_service = get_vector_service(config)
+    logger = get_logger()
+
+    # Uploads are read into pooled buffers, held until their analysis completes.
+    # This caps upload memory to `pool_size` buffers, and so the number of
+    # analyses running at once: further requests wait for a free buffer
+    buffer_pool = _create_buffer_pool(
+        config.upload.pool_size,
+        config.upload.max_file_size_bytes,
+    )
+
+    # Re-uploading the same image with the same comments returns the previous analysis
+    recent_analyses = _RecentAnalyses(_RECENT_ANALYSES_SIZE)
 
     @router.post(
         '/critique',
@@ -139,6 +253,8 @@ def create_analysis_router(config: AppConfig) -> APIRouter:
         and recommendations""",
     )
     async def critique_artwork(
+        agent_service: Annotated[AgentService, Depends(get_agent_service)],
+        vector_service: Annotated[VectorService, Depends(get_vector_service)],
         file: Annotated[UploadFile | None, File()] = None,
         user_comments: Annotated[str | None, Form()] = None,
     ) -> AnalysisResponse:
@@ -153,6 +269,8 @@ def create_analysis_router(config: AppConfig) -> APIRouter:
         analysis even if vector DB is temporarily unavailable.
 
         Args:
+            agent_service: Shared Gemini agent service
+            vector_service: Shared vector database service
             file: Image file to analyze (required)
             user_comments: Optional student comments about their work
 
@@ -170,70 +288,75 @@ def create_analysis_router(config: AppConfig) -> APIRouter:
                 config=config,
             )
 
-            # Read content
-            content = await file.read()
-
-            # Validate size and check if not empty
-            _validate_file_size(content, config.upload.max_file_size_mb)
-
-            # Log the request with context
-            if user_comments:
-                config.logger.info(
-                    'Analyzing image: %s (with user comments)',
+            buffer = await _acquire_buffer(buffer_pool, config.upload.pool_timeout_seconds)
+            try:
+                # Read content, validating size and checking it is not empty
+                size, image_digest = await _read_upload(file, buffer, config.upload.file_size_error)
+
+                cache_key = (image_digest, mime_type, user_comments)
+                cached = recent_analyses.get(cache_key)
+                if cached is not None:
+                    logger.info('Returning previous analysis for image: %s', file.filename)
+                    return cached
+
+                # Log the request with context
+                logger.info(
+                    'Analyzing image: %s%s',
                     file.filename,
+                    ' (with user comments)' if user_comments else '',
                 )
-            else:
-                config.logger.info('Analyzing image: %s', file.filename)
-
-            # Analyze with Gemini AI agent (pass user comments if provided)
-            result = await agent_service.analyze_image(
-                image_bytes=content,
-                mime_type=mime_type,
-                user_text=user_comments,
-            )
+
+                # Analyze with Gemini AI agent (pass user comments if provided).
+                # The image is passed as a view on the pooled buffer, without a copy,
+                # so the buffer is held until the analysis completes
+                result = await agent_service.analyze_image(
+                    image_bytes=memoryview(buffer)[:size],
+                    mime_type=mime_type,
+                    user_text=user_comments,
+                )
+            finally:
+                buffer_pool.put_nowait(buffer)
+
+            recent_analyses.put(cache_key, result)
 
             # ============== RAG: Store critique in vector database ==============
-            # This is wrapped in try/except so the API doesn't fail if DB is down
+            # Critiques are written in batches by a background task, so the API
+            # neither waits for nor fails because of the vector DB
             try:
-                config.logger.debug('Attempting to store critique in vector database')
-
                 # Convert analysis result to ArtCritique for vector storage
-                if isinstance(result, dict):
-                    result = AnalysisResponse(**result)
-
                 critique = ArtCritique.from_analysis_response(result)
-                # Save to Qdrant with filename as identifier
+                # Queue for Qdrant with filename as identifier
                 filename = file.filename or 'unknown'
-                vector_service.save_critique(critique, filename)
+                vector_service.enqueue(critique, filename)
 
-                config.logger.info(
-                    'Critique stored in vector database: %s',
-                    filename,
-                )
-
-            except (ConnectionError, TimeoutError, OSError) as vector_error:
+            except TypeError as vector_error:
                 # Log the error but don't fail the API
-                config.logger.warning(
+                logger.warning(
                     'Failed to store critique in vector database: %s. '
                     'Continuing with analysis response.',
                     str(vector_error),
                 )
-                # Continue - the analysis is still returned to the user
-
-            else:
-                return result
 
         except HTTPException:
             raise
+        except ValueError as e:
+            # Analysis errors are already logged by AgentService
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f'Error analyzing image: {e!s}',
+            ) from e
         except Exception as e:
-            config.logger.exception('Error processing image')
+            logger.exception('Error processing image')
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f'Error analyzing image: {e!s}',
             ) from e
+        else:
+            return result
 
     @router.get(
         '/health',
+        response_model=None,
         summary='Health check',
         description='Check if the analysis service is available',
     )
@@ -246,12 +369,15 @@ def create_analysis_router(config: AppConfig) -> APIRouter:
 
     @router.get(
         '/vector-db-health',
+        response_model=None,
         summary='Vector Database health check',
         description='Check if the vector database is accessible',
     )
-    async def vector_db_health() -> dict[str, str]:
+    async def vector_db_health(
+        vector_service: Annotated[VectorService, Depends(get_vector_service)],
+    ) -> dict[str, str]:
         """Health check for vector database connection."""
-        is_healthy = vector_service.health_check()
+        is_healthy = await vector_service.health_check()
         status_text = 'healthy' if is_healthy else 'unavailable'
 
         return {
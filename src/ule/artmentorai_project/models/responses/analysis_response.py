@@ -1,8 +1,6 @@
 """Response models for artwork analysis."""
 
-from typing import ClassVar
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnalysisResponse(BaseModel):
@@ -13,6 +11,25 @@ class AnalysisResponse(BaseModel):
     Pydantic automatically validates types, ranges, and string lengths.
     """
 
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        json_schema_extra={
+            'example': {
+                'summary': 'Figure drawing with good proportions but perspective errors',
+                'score': 7,
+                'technical_errors': [
+                    'Inconsistent linear perspective',
+                    'Right arm slightly disproportionate',
+                ],
+                'constructive_advice': (
+                    'Practice head construction with guide lines. Your work shows potential; '
+                    'focus on perspective studies.'
+                ),
+            }
+        },
+    )
+
     summary: str = Field(
         ..., min_length=10, max_length=500, description='General summary of the artwork analysis'
     )
@@ -21,8 +38,8 @@ class AnalysisResponse(BaseModel):
 
     technical_errors: list[str] = Field(
         default=[],
-        min_items=0,
-        max_items=10,
+        min_length=0,
+        max_length=10,
         description='List of identified technical errors (anatomy, perspective, etc.)',
     )
 
@@ -32,21 +49,3 @@ class AnalysisResponse(BaseModel):
         max_length=500,
         description='Practical and constructive advice for improvement',
     )
-
-    class Config:
-        """Pydantic configuration for the AnalysisResponse model."""
-
-        json_schema_extra: ClassVar = {
-            'example': {
-                'summary': 'Figure drawing with good proportions but perspective errors',
-                'score': 7,
-                'technical_errors': [
-                    'Inconsistent linear perspective',
-                    'Right arm slightly disproportionate',
-                ],
-                'constructive_advice': (
-                    'Practice head construction with guide lines. Your work shows potential; '
-                    'focus on perspective studies.'
-                ),
-            }
-        }
@@ -12,10 +12,14 @@ database drivers, or framework-specific code.
 """
 
 from .agent_service import AgentService
-from .vector_service import ArtCritique, VectorService
+from .gemini_client import GeminiClient, build_gemini_client
+from .vector_service import ArtCritique, CritiqueHit, VectorService
 
 __all__ = [
     'AgentService',
     'ArtCritique',
+    'CritiqueHit',
+    'GeminiClient',
     'VectorService',
+    'build_gemini_client',
 ]
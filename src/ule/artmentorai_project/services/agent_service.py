@@ -1,31 +1,23 @@
 """AI Agent service for artwork analysis using Pydantic AI and Gemini."""
 
 import os
+from typing import TYPE_CHECKING, Final
 
+from pydantic import ValidationError
 from pydantic_ai import Agent, BinaryContent
+from pydantic_ai.exceptions import UnexpectedModelBehavior
 
 from ..config import AppConfig
+from ..core import get_logger
 from ..models import AnalysisResponse
+from .gemini_client import GeminiClient
 
+if TYPE_CHECKING:
+    from pydantic_ai.models.gemini import GeminiModel
 
-class AgentService:
-    """Service for AI-powered artwork analysis using Pydantic AI and Gemini."""
-
-    def __init__(self, config: AppConfig) -> None:
-        """
-        Initialize the agent service.
-
-        Args:
-            config: Application configuration
-        """
-        self.config = config
-        self.logger = config.logger
-
-        # Initialize Gemini model
-        os.environ['GEMINI_API_KEY'] = config.gemini.api_key
-
-        # System Prompt - Defines the agent role
-        system_prompt = """You are an expert and rigorous art teacher with over 20 years of
+# System Prompt - Defines the agent role
+_SYSTEM_PROMPT: Final[str] = """\
+You are an expert and rigorous art teacher with over 20 years of
                     experience. Your task is to evaluate student artwork with constructive honesty.
 
                     CRITICAL INSTRUCTIONS:
@@ -43,18 +35,65 @@ class AgentService:
                         "constructive_advice": "Specific and actionable advice for improvement"
                     }"""
 
+# User prompt when the student provided context/concerns
+_CONTEXT_PROMPT_TEMPLATE: Final[str] = """\
+The student provided this context: '{user_text}'
+                Analyze the artwork focusing on their specific concerns, but also cover general
+                technical aspects such as:
+                - How well they addressed their stated concerns
+                - Composition, technique, anatomy, and perspective
+                - Concrete technical errors
+                - A fair score from 1-10
+                - Practical advice for improvement
+
+                Respond ONLY in valid JSON format, without additional explanations."""
+
+# User prompt for a rigorous analysis without specific context
+_STANDARD_PROMPT: Final[str] = """\
+Please analyze this artwork in detail and provide structured feedback.
+                Be specific about:
+                - Identified technical strengths
+                - Concrete technical errors (anatomy, perspective, composition, etc.)
+                - A fair score from 1-10
+                - Practical advice for improvement
+
+                Respond ONLY in valid JSON format, without additional explanations."""
+
+
+class AgentService:
+    """Service for AI-powered artwork analysis using Pydantic AI and Gemini."""
+
+    def __init__(self, config: AppConfig, gemini: GeminiClient | None = None) -> None:
+        """
+        Initialize the agent service.
+
+        Args:
+            config: Application configuration
+            gemini: Shared Gemini client. If not provided, Pydantic AI builds its own
+                model from `config.gemini.model_name`.
+        """
+        self.config = config
+        self.logger = get_logger()
+
+        # Initialize Gemini model
+        if gemini is not None:
+            model: GeminiModel | str = gemini.model
+        else:
+            os.environ['GEMINI_API_KEY'] = config.gemini.api_key
+            model = config.gemini.model_name
+
         # Create agent
         self.agent = Agent(
-            model=config.gemini.model_name,  # Reads from .env
+            model=model,
             result_type=AnalysisResponse,
-            system_prompt=system_prompt,
+            system_prompt=_SYSTEM_PROMPT,
         )
 
         self.logger.info('AgentService initialized successfully')
 
     async def analyze_image(
         self,
-        image_bytes: bytes,
+        image_bytes: bytes | memoryview,
         mime_type: str = 'image/jpeg',
         user_text: str | None = None,
     ) -> AnalysisResponse:
@@ -62,7 +101,8 @@ class AgentService:
         Analyze an artwork image using Gemini 2.5 Flash.
 
         Args:
-            image_bytes: Raw image bytes to analyze
+            image_bytes: Raw image bytes to analyze. A memoryview is read in place
+                and must stay valid until the analysis completes.
             mime_type: MIME type of the image (image/jpeg, image/png, etc.)
             user_text: Optional user-provided context or specific concerns about the artwork
 
@@ -70,26 +110,18 @@ class AgentService:
             AnalysisResponse: Structured analysis with summary, score, errors, and advice
 
         Raises:
-            ValueError: If there's an error calling Gemini
-            ValidationError: If response doesn't match AnalysisResponse model
+            ValueError: If there's an error calling Gemini, or if its response doesn't
+                match the AnalysisResponse model
         """
         try:
-            # Encode image to base64
-            image_content = BinaryContent(data=image_bytes, media_type=mime_type)
+            # Wrap the raw image: Pydantic AI base64-encodes it once, when building the
+            # Gemini request. `data` is typed as bytes, but any buffer works.
+            image_content = BinaryContent(data=image_bytes, media_type=mime_type)  # type: ignore[arg-type]
 
             # Create user prompt
             if user_text:
                 # Multimodal: user provided context/concerns
-                prompt = f"""The student provided this context: '{user_text}'
-                Analyze the artwork focusing on their specific concerns, but also cover general
-                technical aspects such as:
-                - How well they addressed their stated concerns
-                - Composition, technique, anatomy, and perspective
-                - Concrete technical errors
-                - A fair score from 1-10
-                - Practical advice for improvement
-
-                Respond ONLY in valid JSON format, without additional explanations."""
+                prompt = _CONTEXT_PROMPT_TEMPLATE.format(user_text=user_text)
 
                 self.logger.info(
                     'Starting artwork analysis with Gemini %s (with user context)',
@@ -97,14 +129,7 @@ class AgentService:
                 )
             else:
                 # Default: rigorous analysis without specific context
-                prompt = """Please analyze this artwork in detail and provide structured feedback.
-                Be specific about:
-                - Identified technical strengths
-                - Concrete technical errors (anatomy, perspective, composition, etc.)
-                - A fair score from 1-10
-                - Practical advice for improvement
-
-                Respond ONLY in valid JSON format, without additional explanations."""
+                prompt = _STANDARD_PROMPT
 
             self.logger.info(
                 'Starting artwork analysis with Gemini %s (standard analysis)',
@@ -113,31 +138,22 @@ class AgentService:
 
             # Call agent (Pydantic AI handles image multimodal with Gemini)
             result = await self.agent.run([prompt, image_content])
-            analysis_data = result.data
 
-            # If result is a dict, convert to AnalysisResponse
+            # Pydantic AI already validates the output against `AnalysisResponse`.
+            # A plain dict is trusted as is, without validating it a second time
+            analysis_data = result.data
             if isinstance(analysis_data, dict):
-                analysis_data = AnalysisResponse(**analysis_data)
-            elif not isinstance(analysis_data, AnalysisResponse):
-                # Try to convert via model_validate
-                try:
-                    analysis_data = AnalysisResponse.model_validate(analysis_data)
-                except (TypeError, ValueError):
-                    # Last resort: convert to dict then to model
-                    if hasattr(analysis_data, 'model_dump'):
-                        analysis_data = AnalysisResponse(**analysis_data.model_dump())
-                    else:
-                        analysis_data = AnalysisResponse(**dict(analysis_data))
+                analysis_data = AnalysisResponse.model_construct(**analysis_data)
 
             self.logger.info('Analysis completed. Score: %s/10', analysis_data.score)
-            if hasattr(analysis_data, 'model_dump'):
-                return analysis_data.model_dump()
-            if isinstance(analysis_data, dict):
-                return analysis_data
-            return AnalysisResponse(**vars(analysis_data))
+        except (ValidationError, UnexpectedModelBehavior) as e:
+            # Gemini answered, but not with a valid analysis: no traceback needed
+            self.logger.warning('Invalid analysis returned by Gemini: %s', e)
+            msg = f'Gemini image analysis error: {e!s}'
+            raise ValueError(msg) from e
         except Exception as e:
             self.logger.exception('Error analyzing image')
             msg = f'Gemini image analysis error: {e!s}'
             raise ValueError(msg) from e
         else:
-            return result.data if hasattr(result, 'data') else result
+            return analysis_data
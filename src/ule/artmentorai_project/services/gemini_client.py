@@ -0,0 +1,105 @@
+"""Long-lived HTTP client for the Google Gemini API."""
+
+import logging
+import ssl
+
+import httpx
+from pydantic_ai.models.gemini import GeminiModel
+from pydantic_ai.providers.google_gla import GoogleGLAProvider
+
+from ..config import GeminiConfig
+
+GEMINI_API_URL = 'https://generativelanguage.googleapis.com/v1beta'
+
+# Idle connections are kept open long enough to survive gaps between requests
+_MAX_KEEPALIVE_CONNECTIONS = 64
+_KEEPALIVE_EXPIRY_SECONDS = 300
+
+
+class GeminiClient:
+    """
+    Gemini model bound to a shared HTTP connection pool.
+
+    One instance is built per worker process at startup and reused by every
+    request, so connections (DNS, TCP and TLS) to the Gemini API are kept alive
+    instead of being re-established per analysis.
+    """
+
+    def __init__(
+        self,
+        config: GeminiConfig,
+        http_client: httpx.AsyncClient,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """
+        Initialize the Gemini client.
+
+        Args:
+            config: Gemini configuration
+            http_client: HTTP client used for every Gemini API call
+            logger: Logger instance for debug info
+        """
+        self.config = config
+        self.http_client = http_client
+        self.logger = logger or logging.getLogger(__name__)
+
+        provider = GoogleGLAProvider(api_key=config.api_key, http_client=http_client)
+        self.model = GeminiModel(config.model_name, provider=provider)
+
+    async def warmup(self) -> None:
+        """
+        Open a connection to the Gemini API ahead of the first request.
+
+        Issues a cheap `models.list` call. Failures are logged and ignored: the
+        first analysis request will simply pay the connection cost instead.
+        """
+        try:
+            response = await self.http_client.get(
+                f'{GEMINI_API_URL}/models',
+                params={'pageSize': 1},
+                headers={'x-goog-api-key': self.config.api_key},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.logger.warning('Gemini warm-up request failed: %s', e)
+        else:
+            self.logger.info('Gemini connection warmed up')
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.http_client.aclose()
+
+
+def build_gemini_client(
+    config: GeminiConfig,
+    ssl_context: ssl.SSLContext | None = None,
+    logger: logging.Logger | None = None,
+) -> GeminiClient:
+    """
+    Build the Gemini client and its HTTP connection pool.
+
+    Connections use HTTP/2 and are kept alive between requests. Every connection
+    of the pool shares the same SSL context, which lets OpenSSL resume TLS
+    sessions instead of performing a full handshake for each new connection.
+
+    Args:
+        config: Gemini configuration
+        ssl_context: SSL context used to verify the Gemini API certificates.
+            Defaults to the certifi bundle used by httpx.
+        logger: Logger instance for debug info
+
+    Returns:
+        GeminiClient: Client ready to be shared across requests
+    """
+    # The transport owns the pool, so pool settings must be given to it directly
+    transport = httpx.AsyncHTTPTransport(
+        verify=ssl_context if ssl_context is not None else True,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        retries=1,
+    )
+    http_client = httpx.AsyncClient(transport=transport, timeout=config.timeout_seconds)
+    return GeminiClient(config, http_client, logger)
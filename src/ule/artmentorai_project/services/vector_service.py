@@ -4,16 +4,83 @@ This module provides long-term memory capabilities using Qdrant vector database
 and FastEmbed for local embedding generation.
 """
 
+import asyncio
+import functools
+import hashlib
+import itertools
 import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from typing import Any, NamedTuple
 
-from fastembed.embedding import FlagEmbedding
-from qdrant_client import QdrantClient
+import httpx
+import numpy as np
+from fastembed import TextEmbedding
+from grpc import RpcError
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
-from qdrant_client.http.models import Distance, PointStruct, VectorParams
+from qdrant_client.http.models import (
+    Datatype,
+    Distance,
+    PointStruct,
+    QueryRequest,
+    ScoredPoint,
+    VectorParams,
+)
 
 from ..models import AnalysisResponse
 
+# Errors raised by the Qdrant client, over REST or gRPC
+_QDRANT_ERRORS = (ResponseHandlingException, UnexpectedResponse, RpcError)
+
+# Collections known to exist, by Qdrant host, port and collection name
+_COLLECTION_READY: set[tuple[str, int, str]] = set()
+
+# Folder holding the downloaded embedding model files
+_EMBEDDING_CACHE_DIR = './embeddings_cache'
+
+# Critique texts are cut to this length before embedding (bge-small reads 512 tokens)
+_MAX_EMBEDDING_TEXT_LENGTH = 512
+
+# Serializes the first load of the embedding model
+_EMBEDDER_LOCK = threading.Lock()
+
+# Payload fields of a stored critique, in the order of CritiqueHit's fields
+_PAYLOAD_KEYS = ('filename', 'score', 'summary', 'advice', 'timestamp')
+
+# Idle connections to Qdrant are kept open and reused across requests
+_MAX_KEEPALIVE_CONNECTIONS = 32
+_KEEPALIVE_EXPIRY_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=1)
+def _load_embedder(model_name: str, cache_dir: str) -> TextEmbedding:
+    return TextEmbedding(model_name=model_name, cache_dir=cache_dir)
+
+
+def _shared_embedder(model_name: str, cache_dir: str) -> TextEmbedding:
+    """
+    Return the process-wide embedding model, loading it on first use.
+
+    Loading reads the ONNX weights and tokenizer files and builds an inference
+    session, so every VectorService of the process shares a single instance.
+    The lock ensures concurrent first calls load the model only once.
+
+    Args:
+        model_name: FastEmbed model name
+        cache_dir: Folder holding the downloaded model files
+
+    Returns:
+        TextEmbedding: Shared embedding model
+    """
+    with _EMBEDDER_LOCK:
+        return _load_embedder(model_name, cache_dir)
+
 
 class ArtCritique:
     """Data model for storing artwork critiques in vector database."""
@@ -32,21 +99,47 @@ class ArtCritique:
             score: Score from 1-10
             technical_errors: List of identified technical errors
             constructive_advice: Constructive advice for improvement
+
+        Raises:
+            TypeError: If technical_errors is not a list of strings. Only checked
+                when assertions are enabled (not under `python -O`).
         """
+        if __debug__:
+            # Validated once here, so saving the critique does not check it again
+            if type(technical_errors) is not list:
+                msg = f'technical_errors must be a list, got {type(technical_errors)}'
+                raise TypeError(msg)
+            if any(type(error) is not str for error in technical_errors):
+                msg = 'technical_errors must contain only strings'
+                raise TypeError(msg)
+
         self.summary = summary
         self.score = score
         self.technical_errors = technical_errors
         self.constructive_advice = constructive_advice
-        self.timestamp = datetime.now(tz=UTC).isoformat()
+        # Creation time, formatted only when the critique is saved
+        self.timestamp_ns = time.time_ns()
+        self._embedding_text: str | None = None
+
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 creation time of the critique, in UTC."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=UTC).isoformat()
 
     def get_text_for_embedding(self) -> str:
         """Get concatenated text for embedding generation.
 
+        The text is built once and reused by later calls. It is truncated to
+        `_MAX_EMBEDDING_TEXT_LENGTH` characters, as the embedding model ignores
+        tokens past its context window anyway.
+
         Returns:
             str: Combined text of summary and technical errors
         """
-        errors_text = ' '.join(self.technical_errors)
-        return f'{self.summary} {errors_text}'
+        if self._embedding_text is None:
+            text = ' '.join((self.summary, *self.technical_errors))
+            self._embedding_text = text[:_MAX_EMBEDDING_TEXT_LENGTH]
+        return self._embedding_text
 
     @classmethod
     def from_analysis_response(
@@ -69,6 +162,20 @@ class ArtCritique:
         )
 
 
+class CritiqueHit(NamedTuple):
+    """Critique found by a similarity search, with its similarity score.
+
+    Use `_asdict()` to get the result as a dict.
+    """
+
+    similarity_score: float
+    filename: str | None
+    score: int | None
+    summary: str | None
+    advice: str | None
+    timestamp: str | None
+
+
 class VectorService:
     """Service for managing vector embeddings and Qdrant interactions.
 
@@ -83,53 +190,88 @@ class VectorService:
     EMBEDDING_MODEL = 'BAAI/bge-small-en-v1.5'
     EMBEDDING_SIZE = 384
     DISTANCE_METRIC = Distance.COSINE
+    # bge-small embeddings keep their quality in half precision, at half the storage
+    VECTOR_DATATYPE = Datatype.FLOAT16
+    UPSERT_BATCH_SIZE = 32
+    EMBEDDING_BATCH_SIZE = 32
+    EMBEDDING_CACHE_SIZE = 10_000
+    EMBEDDING_CACHE_TTL_SECONDS = 24 * 60 * 60
+    MAX_PENDING_CRITIQUES = 256
+    MAX_CONCURRENT_REQUESTS = 2
+    HEALTH_CHECK_TTL_SECONDS = 5.0
+    PIPELINE_DEPTH = 2
 
     def __init__(
         self,
         host: str = 'localhost',
         port: int = 6333,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
         logger: logging.Logger | None = None,
     ) -> None:
         """Initialize VectorService.
 
+        By default Qdrant is reached over gRPC, which sends vectors as protobuf
+        instead of JSON. The Qdrant server must expose its gRPC port.
+
         Args:
             host: Qdrant server host
-            port: Qdrant server port
+            port: Qdrant server REST port
+            grpc_port: Qdrant server gRPC port
+            prefer_grpc: Use gRPC instead of REST where the client supports it
             logger: Logger instance for debug info
 
         Raises:
-            RuntimeError: If Qdrant connection fails
+            RuntimeError: If the Qdrant client or the embedding model cannot be created
         """
         self.logger = logger or logging.getLogger(__name__)
         self.host = host
         self.port = port
+        self.grpc_port = grpc_port
+        self.prefer_grpc = prefer_grpc
+
+        # Critiques waiting to be written by the background flusher
+        self._pending: asyncio.Queue[tuple[ArtCritique, str]] = asyncio.Queue(
+            maxsize=self.MAX_PENDING_CRITIQUES,
+        )
+        self._flusher: asyncio.Task[None] | None = None
+
+        # Bounds the upserts and searches in flight: a couple of concurrent
+        # requests overlap network time without overloading Qdrant
+        self._requests = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Monotonic time until which the last successful health check is reused
+        self._healthy_until = 0.0
+
+        # Recent embeddings by text digest: (expiry time, vector), least recently used first
+        self._embedding_cache: OrderedDict[bytes, tuple[float, list[float]]] = OrderedDict()
 
         try:
-            # Initialize Qdrant client
-            self.client = QdrantClient(
+            # Initialize Qdrant client (connects lazily, on the first request)
+            self.client = AsyncQdrantClient(
                 host=host,
                 port=port,
+                grpc_port=grpc_port,
+                prefer_grpc=prefer_grpc,
                 timeout=10.0,
+                # Only used by the REST transport
+                limits=httpx.Limits(
+                    max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+                ),
             )
-            self.logger.debug('Connected to Qdrant at %s:%s', host, port)
 
-            # Initialize embedding model (downloads on first use)
-            self.embedding_model = FlagEmbedding(
-                model_name=self.EMBEDDING_MODEL,
-                cache_folder='./embeddings_cache',
-            )
+            # Initialize embedding model (downloads on first use). FastEmbed serves
+            # bge-small as an INT8-quantized, graph-optimized ONNX model
+            self.embedding_model = _shared_embedder(self.EMBEDDING_MODEL, _EMBEDDING_CACHE_DIR)
             self.logger.debug('Loaded embedding model: %s', self.EMBEDDING_MODEL)
 
-            # Ensure collection exists
-            self._ensure_collection_exists()
-            self.logger.info('VectorService initialized with collection: %s', self.COLLECTION_NAME)
-
         except Exception as e:
             self.logger.exception('Failed to initialize VectorService')
-            msg = f'VectorService initialization failed: {e!s}'
+            msg = 'VectorService initialization failed'
             raise RuntimeError(msg) from e
 
-    def _ensure_collection_exists(self) -> None:
+    async def _ensure_collection_exists(self) -> None:
         """Ensure that the art_portfolio collection exists.
 
         Creates collection if it doesn't exist with proper vector parameters.
@@ -137,49 +279,118 @@ class VectorService:
         Raises:
             RuntimeError: If collection creation fails
         """
+        # Collections are never dropped by the service: once seen, skip the check
+        collection_key = (self.host, self.port, self.COLLECTION_NAME)
+        if collection_key in _COLLECTION_READY:
+            return
+
         try:
             # Check if collection exists
-            collections = self.client.get_collections()
-            collection_names = [col.name for col in collections.collections]
-
-            if self.COLLECTION_NAME not in collection_names:
+            if not await self.client.collection_exists(self.COLLECTION_NAME):
                 self.logger.info('Creating collection: %s', self.COLLECTION_NAME)
-                self.client.create_collection(
+                await self.client.create_collection(
                     collection_name=self.COLLECTION_NAME,
                     vectors_config=VectorParams(
                         size=self.EMBEDDING_SIZE,
                         distance=self.DISTANCE_METRIC,
+                        datatype=self.VECTOR_DATATYPE,
+                        on_disk=False,
                     ),
                 )
                 self.logger.info('Collection created: %s', self.COLLECTION_NAME)
             else:
                 self.logger.debug('Collection already exists: %s', self.COLLECTION_NAME)
 
-        except (ResponseHandlingException, UnexpectedResponse) as e:
+            _COLLECTION_READY.add(collection_key)
+
+        except _QDRANT_ERRORS as e:
             self.logger.exception('Failed to manage collection %s', self.COLLECTION_NAME)
-            msg = f'Failed to manage collection {self.COLLECTION_NAME}: {e!s}'
+            msg = f'Failed to manage collection {self.COLLECTION_NAME}'
             raise RuntimeError(msg) from e
 
-    def _validate_critique(self, critique: ArtCritique) -> None:
-        """Validate critique data before saving.
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings in a worker thread, keeping the event loop free.
+
+        Embeddings of recently seen texts are served from an LRU cache with a
+        TTL, so only new texts reach the model.
 
         Args:
-            critique: ArtCritique object to validate
+            texts: Texts to embed
 
-        Raises:
-            TypeError: If critique data is invalid
+        Returns:
+            list[list[float]]: One embedding vector per text
         """
-        # Validate technical_errors is a list
-        if not isinstance(critique.technical_errors, list):
-            msg = f'technical_errors must be a list, got {type(critique.technical_errors)}'
-            raise TypeError(msg)
+        now = time.monotonic()
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+        vectors: dict[int, list[float]] = {}
+        for index, key in enumerate(keys):
+            cached = self._embedding_cache.get(key)
+            if cached is not None and cached[0] > now:
+                self._embedding_cache.move_to_end(key)
+                vectors[index] = cached[1]
+
+        misses = [index for index in range(len(texts)) if index not in vectors]
+        if misses:
+            missing_texts = [texts[index] for index in misses]
+
+            def embed() -> list[list[float]]:
+                # Each batch is padded to its longest text: embedding texts sorted by
+                # length keeps similar lengths together and wastes less on padding
+                order = sorted(range(len(missing_texts)), key=lambda i: len(missing_texts[i]))
+                embeddings = np.stack(
+                    list(
+                        self.embedding_model.embed(
+                            [missing_texts[i] for i in order],
+                            batch_size=self.EMBEDDING_BATCH_SIZE,
+                        )
+                    )
+                )
+                restored = np.empty_like(embeddings)
+                restored[order] = embeddings
+                # Qdrant points only take lists: convert the whole matrix in one call
+                return restored.tolist()
+
+            expires_at = now + self.EMBEDDING_CACHE_TTL_SECONDS
+            for index, vector in zip(misses, await asyncio.to_thread(embed), strict=True):
+                vectors[index] = vector
+                self._embedding_cache[keys[index]] = (expires_at, vector)
+                self._embedding_cache.move_to_end(keys[index])
+
+            while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
 
-        # Validate list contains only strings
-        if not all(isinstance(err, str) for err in critique.technical_errors):
-            msg = 'technical_errors must contain only strings'
-            raise TypeError(msg)
+        return [vectors[index] for index in range(len(texts))]
 
-    def save_critique(
+    @staticmethod
+    def _build_point(
+        critique: ArtCritique,
+        filename: str,
+        embedding_vector: list[float],
+    ) -> PointStruct:
+        """Build the Qdrant point storing a critique.
+
+        Args:
+            critique: ArtCritique object with analysis data
+            filename: Name/ID of the artwork file
+            embedding_vector: Embedding of the critique text
+
+        Returns:
+            PointStruct: Point ready to be upserted
+        """
+        return PointStruct(
+            # Same ID for the same filename in every process, without collisions
+            id=str(uuid.uuid5(uuid.NAMESPACE_URL, filename)),
+            vector=embedding_vector,
+            payload={
+                'filename': filename,
+                'score': critique.score,
+                'summary': critique.summary,
+                'advice': critique.constructive_advice,
+                'timestamp': critique.timestamp,
+            },
+        )
+
+    async def save_critique(
         self,
         critique: ArtCritique,
         filename: str,
@@ -197,65 +408,223 @@ class VectorService:
             Optional[str]: Point ID if successful, None if failed
 
         Raises:
-            ValueError: If critique data is invalid
+            RuntimeError: If the critique cannot be saved
+        """
+        [point_id] = await self.save_critiques_batch([critique], [filename])
+        return point_id
+
+    async def save_critiques_batch(
+        self,
+        critiques: list[ArtCritique],
+        filenames: list[str],
+    ) -> list[str]:
+        """Save several artwork critiques to vector database at once.
+
+        All embeddings are generated by a single batched FastEmbed call and all
+        points are stored with a single Qdrant upsert.
+
+        Args:
+            critiques: ArtCritique objects with analysis data
+            filenames: Name/ID of the artwork file of each critique
+
+        Returns:
+            list[str]: Point IDs, in the order of the critiques
+
+        Raises:
+            RuntimeError: If the critiques cannot be saved
         """
         try:
-            # Validate critique data
-            self._validate_critique(critique)
+            # Generate embeddings from critique texts
+            texts = [critique.get_text_for_embedding() for critique in critiques]
+            self.logger.debug('Generating embeddings for %d file(s)', len(texts))
 
-            # Generate embedding from critique text
-            text_for_embedding = critique.get_text_for_embedding()
-            self.logger.debug('Generating embedding for file: %s', filename)
+            embeddings = await self._embed(texts)
 
-            embeddings_generator = self.embedding_model.embed(text_for_embedding)
-            embeddings_list = list(embeddings_generator)
-            embedding_vector = embeddings_list[0].tolist()
+            # Upsert points to Qdrant without waiting for them to be indexed
+            points = [
+                self._build_point(critique, filename, embedding)
+                for critique, filename, embedding in zip(
+                    critiques, filenames, embeddings, strict=True
+                )
+            ]
+            async with self._requests:
+                await self.client.upsert(
+                    collection_name=self.COLLECTION_NAME,
+                    points=points,
+                    wait=False,
+                )
 
-            # Create point for Qdrant
-            point_id = hash(filename) % (10**8)  # Generate consistent ID from filename
+            self.logger.info('Saved %d critique(s) to Qdrant', len(points))
+            return [str(point.id) for point in points]
 
-            payload = {
-                'filename': filename,
-                'score': critique.score,
-                'summary': critique.summary,
-                'advice': critique.constructive_advice,
-                'timestamp': critique.timestamp,
-            }
-
-            # Upsert point to Qdrant
-            self.client.upsert(
-                collection_name=self.COLLECTION_NAME,
-                points=[
-                    PointStruct(
-                        id=point_id,
-                        vector=embedding_vector,
-                        payload=payload,
-                    )
-                ],
-            )
+        except _QDRANT_ERRORS as e:
+            self.logger.exception('Qdrant error saving critiques for %s', filenames)
+            msg = 'Failed to save critiques to Qdrant'
+            raise RuntimeError(msg) from e
+
+        except Exception as e:
+            self.logger.exception('Unexpected error saving critiques for %s', filenames)
+            msg = 'Unexpected error in save_critiques_batch'
+            raise RuntimeError(msg) from e
+
+    async def save_critiques_many(
+        self,
+        critiques: list[ArtCritique],
+        filenames: list[str],
+    ) -> list[str]:
+        """Save any number of artwork critiques, in batches.
+
+        Critiques are saved by `save_critiques_pipelined`, in batches of
+        `UPSERT_BATCH_SIZE`: one batch is embedded at a time, while the previous
+        ones are upserted, so the embedding model is never run concurrently.
+
+        Args:
+            critiques: ArtCritique objects with analysis data
+            filenames: Name/ID of the artwork file of each critique
+
+        Returns:
+            list[str]: Point IDs, in the order of the critiques
+
+        Raises:
+            RuntimeError: If the critiques cannot be saved
+        """
+        return await self.save_critiques_pipelined(zip(critiques, filenames, strict=True))
+
+    async def save_critiques_pipelined(
+        self,
+        items: Iterable[tuple[ArtCritique, str]],
+    ) -> list[str]:
+        """Save a stream of artwork critiques, overlapping embedding with upserts.
 
-            self.logger.info('Critique saved to Qdrant: %s (point_id: %s)', filename, point_id)
-            return str(point_id)
+        Critiques are read in batches of `UPSERT_BATCH_SIZE`. One stage embeds
+        batches while a second one upserts the previous ones, with at most
+        `PIPELINE_DEPTH` embedded batches waiting in between. Unlike
+        `save_critiques_many`, only a few batches are held in memory at once,
+        so `items` can be a generator over a large backfill.
 
-        except TypeError:
-            self.logger.exception('Validation error saving critique')
-            raise
+        Args:
+            items: Pairs of ArtCritique object and Name/ID of its artwork file
+
+        Returns:
+            list[str]: Point IDs, in the order of the critiques
 
-        except (ResponseHandlingException, UnexpectedResponse) as e:
-            self.logger.exception('Qdrant error saving critique for %s', filename)
-            msg = f'Failed to save critique to Qdrant: {e!s}'
+        Raises:
+            RuntimeError: If the critiques cannot be saved
+        """
+        embedded: asyncio.Queue[list[PointStruct] | None] = asyncio.Queue(self.PIPELINE_DEPTH)
+
+        async def embed_batches() -> None:
+            iterator = iter(items)
+            try:
+                while batch := list(itertools.islice(iterator, self.UPSERT_BATCH_SIZE)):
+                    texts = [critique.get_text_for_embedding() for critique, _ in batch]
+                    embeddings = await self._embed(texts)
+                    await embedded.put(
+                        [
+                            self._build_point(critique, filename, embedding)
+                            for (critique, filename), embedding in zip(
+                                batch, embeddings, strict=True
+                            )
+                        ]
+                    )
+            except Exception:
+                # Wake up the upsert stage, which then re-raises the error
+                await embedded.put(None)
+                raise
+            await embedded.put(None)
+
+        point_ids: list[str] = []
+        embedder = asyncio.create_task(embed_batches())
+        try:
+            while (points := await embedded.get()) is not None:
+                async with self._requests:
+                    await self.client.upsert(
+                        collection_name=self.COLLECTION_NAME,
+                        points=points,
+                        wait=False,
+                    )
+                point_ids.extend(str(point.id) for point in points)
+            await embedder
+
+        except _QDRANT_ERRORS as e:
+            self.logger.exception('Qdrant error saving critiques (%d saved)', len(point_ids))
+            msg = 'Failed to save critiques to Qdrant'
             raise RuntimeError(msg) from e
 
         except Exception as e:
-            self.logger.exception('Unexpected error saving critique for %s', filename)
-            msg = f'Unexpected error in save_critique: {e!s}'
+            self.logger.exception('Unexpected error saving critiques (%d saved)', len(point_ids))
+            msg = 'Unexpected error in save_critiques_pipelined'
             raise RuntimeError(msg) from e
 
-    def search_similar_critiques(
+        finally:
+            embedder.cancel()
+
+        self.logger.info('Saved %d critique(s) to Qdrant', len(point_ids))
+        return point_ids
+
+    async def bulk_ingest(
+        self,
+        critiques: list[ArtCritique],
+        filenames: list[str],
+        processes: int,
+    ) -> int:
+        """Save a large number of critiques using several processes.
+
+        Critiques are sharded round-robin across a pool of worker processes. Each
+        worker builds its own VectorService (Qdrant client and embedding model),
+        so embedding runs in parallel instead of being limited by the GIL. The
+        model files are shared through the embedding cache folder on disk.
+
+        Meant for offline backfills. The collection is created first if needed,
+        then the process pool is waited on from a worker thread, so the event
+        loop stays free until every shard is saved.
+
+        Args:
+            critiques: ArtCritique objects with analysis data
+            filenames: Name/ID of the artwork file of each critique
+            processes: Number of worker processes, at least 1
+
+        Returns:
+            int: Number of critiques saved
+
+        Raises:
+            ValueError: If processes is lower than 1
+            RuntimeError: If the collection cannot be created or the critiques
+                cannot be saved
+        """
+        if processes < 1:
+            msg = f'processes must be at least 1, got {processes}'
+            raise ValueError(msg)
+
+        # Created once here: every shard upserts into the same collection
+        await self._ensure_collection_exists()
+
+        options = {
+            'host': self.host,
+            'port': self.port,
+            'grpc_port': self.grpc_port,
+            'prefer_grpc': self.prefer_grpc,
+        }
+        shards = [
+            (options, critiques[index::processes], filenames[index::processes])
+            for index in range(processes)
+        ]
+
+        def ingest() -> list[int]:
+            # Spawned workers do not inherit the gRPC and ONNX Runtime threads of this process
+            with multiprocessing.get_context('spawn').Pool(processes) as pool:
+                return pool.starmap(_ingest_shard, shards)
+
+        saved = await asyncio.to_thread(ingest)
+
+        self.logger.info('Bulk ingested %d critique(s) with %d process(es)', sum(saved), processes)
+        return sum(saved)
+
+    async def search_similar_critiques(
         self,
         query_text: str,
         limit: int = 5,
-    ) -> list[dict]:
+    ) -> list[CritiqueHit]:
         """Search for similar critiques in the vector database.
 
         Args:
@@ -263,54 +632,215 @@ class VectorService:
             limit: Maximum number of results to return
 
         Returns:
-            list[dict]: List of similar critiques with scores
+            list[CritiqueHit]: List of similar critiques with scores
 
         Raises:
             RuntimeError: If search fails
         """
         try:
             # Generate embedding for query
-            query_embedding = self.embedding_model.embed(query_text).tolist()
+            [query_embedding] = await self._embed([query_text])
 
             # Search in Qdrant
-            search_results = self.client.search(
-                collection_name=self.COLLECTION_NAME,
-                query_vector=query_embedding,
-                limit=limit,
-            )
+            async with self._requests:
+                response = await self.client.query_points(
+                    collection_name=self.COLLECTION_NAME,
+                    query=query_embedding,
+                    limit=limit,
+                    with_payload=True,
+                )
+
+            # Format results
+            results = [self._format_search_result(result) for result in response.points]
+
+            self.logger.debug('Found %d similar critiques for query', len(results))
+
+        except _QDRANT_ERRORS as e:
+            self.logger.exception('Error searching critiques')
+            msg = 'Failed to search critiques'
+            raise RuntimeError(msg) from e
+        else:
+            return results
+
+    async def search_similar_critiques_batch(
+        self,
+        queries: list[str],
+        limit: int = 5,
+    ) -> list[list[CritiqueHit]]:
+        """Search for critiques similar to each of several queries at once.
+
+        All queries are embedded by a single batched FastEmbed call and searched
+        with a single Qdrant batch request.
+
+        Args:
+            queries: Texts to search for similar critiques
+            limit: Maximum number of results to return per query
+
+        Returns:
+            list[list[CritiqueHit]]: Similar critiques with scores, one list per query
+
+        Raises:
+            RuntimeError: If search fails
+        """
+        try:
+            # Generate embeddings for all queries
+            query_embeddings = await self._embed(queries)
+
+            # Search in Qdrant
+            requests = [
+                QueryRequest(query=query_embedding, limit=limit, with_payload=True)
+                for query_embedding in query_embeddings
+            ]
+            async with self._requests:
+                responses = await self.client.query_batch_points(
+                    collection_name=self.COLLECTION_NAME,
+                    requests=requests,
+                )
 
             # Format results
             results = [
-                {
-                    'similarity_score': result.score,
-                    'filename': result.payload.get('filename'),
-                    'score': result.payload.get('score'),
-                    'summary': result.payload.get('summary'),
-                    'advice': result.payload.get('advice'),
-                    'timestamp': result.payload.get('timestamp'),
-                }
-                for result in search_results
+                [self._format_search_result(result) for result in response.points]
+                for response in responses
             ]
 
-            self.logger.debug('Found %d similar critiques for query', len(results))
+            self.logger.debug('Searched similar critiques for %d queries', len(results))
 
-        except (ResponseHandlingException, UnexpectedResponse) as e:
+        except _QDRANT_ERRORS as e:
             self.logger.exception('Error searching critiques')
-            msg = f'Failed to search critiques: {e!s}'
+            msg = 'Failed to search critiques'
             raise RuntimeError(msg) from e
         else:
             return results
 
-    def health_check(self) -> bool:
+    @staticmethod
+    def _format_search_result(result: ScoredPoint) -> CritiqueHit:
+        """Format a Qdrant search hit as a critique with its similarity score.
+
+        Args:
+            result: Qdrant search hit
+
+        Returns:
+            CritiqueHit: Similar critique with its similarity score
+        """
+        payload = result.payload or {}
+        return CritiqueHit(result.score, *map(payload.get, _PAYLOAD_KEYS))
+
+    async def health_check(self) -> bool:
         """Check if Qdrant connection is healthy.
 
+        Checks that the collection is reachable. A healthy result is reused for
+        `HEALTH_CHECK_TTL_SECONDS`, so frequent probes don't all reach Qdrant.
+
         Returns:
             bool: True if connection is healthy, False otherwise
         """
+        now = time.monotonic()
+        if now < self._healthy_until:
+            return True
+
         try:
-            self.client.get_collections()
-        except (ResponseHandlingException, UnexpectedResponse) as e:
+            healthy = await self.client.collection_exists(self.COLLECTION_NAME)
+        except _QDRANT_ERRORS as e:
             self.logger.warning('Health check failed: %s', e)
             return False
+
+        if healthy:
+            self._healthy_until = now + self.HEALTH_CHECK_TTL_SECONDS
         else:
-            return True
+            self.logger.warning(
+                'Health check failed: collection %s not found', self.COLLECTION_NAME
+            )
+        return healthy
+
+    def enqueue(
+        self,
+        critique: ArtCritique,
+        filename: str,
+    ) -> None:
+        """Queue an artwork critique to be saved by the background flusher.
+
+        Queued critiques are embedded and upserted in batches, so callers never
+        wait for Qdrant. When `MAX_PENDING_CRITIQUES` critiques are already
+        waiting (Qdrant is slow or down), the critique is dropped instead, which
+        bounds the memory used by the queue. Requires `start` to have been called.
+
+        Args:
+            critique: ArtCritique object with analysis data
+            filename: Name/ID of the artwork file
+        """
+        try:
+            self._pending.put_nowait((critique, filename))
+        except asyncio.QueueFull:
+            self.logger.warning('Pending critiques queue is full, dropped critique: %s', filename)
+        else:
+            self.logger.debug('Critique queued for vector database: %s', filename)
+
+    async def start(self) -> None:
+        """Ensure the collection exists and start writing queued critiques to Qdrant.
+
+        Raises:
+            RuntimeError: If the collection cannot be checked or created
+        """
+        await self._ensure_collection_exists()
+        self.logger.info('VectorService initialized with collection: %s', self.COLLECTION_NAME)
+
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_pending())
+
+    async def stop(self) -> None:
+        """Write the remaining queued critiques, then stop the background task."""
+        if self._flusher is None:
+            return
+
+        await self._pending.join()
+        self._flusher.cancel()
+        self._flusher = None
+
+    async def _flush_pending(self) -> None:
+        """Drain the pending queue, upserting up to `UPSERT_BATCH_SIZE` critiques at once."""
+        while True:
+            batch = [await self._pending.get()]
+            while len(batch) < self.UPSERT_BATCH_SIZE and not self._pending.empty():
+                batch.append(self._pending.get_nowait())
+
+            critiques = [critique for critique, _ in batch]
+            filenames = [filename for _, filename in batch]
+            try:
+                await self.save_critiques_batch(critiques, filenames)
+            except RuntimeError:
+                # Already logged: drop the batch, requests are not affected
+                self.logger.warning('Dropped %d critique(s)', len(batch))
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    async def close(self) -> None:
+        """Close the connection to Qdrant."""
+        await self.client.close()
+
+
+def _ingest_shard(
+    options: dict[str, Any],
+    critiques: list[ArtCritique],
+    filenames: list[str],
+) -> int:
+    """Save a shard of critiques from a `VectorService.bulk_ingest` worker process.
+
+    Args:
+        options: Arguments of the worker's VectorService (Qdrant host and ports)
+        critiques: ArtCritique objects with analysis data
+        filenames: Name/ID of the artwork file of each critique
+
+    Returns:
+        int: Number of critiques saved
+    """
+
+    async def ingest() -> int:
+        service = VectorService(**options)
+        try:
+            point_ids = await service.save_critiques_many(critiques, filenames)
+        finally:
+            await service.close()
+        return len(point_ids)
+
+    return asyncio.run(ingest())
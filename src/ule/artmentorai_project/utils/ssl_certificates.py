@@ -1,6 +1,10 @@
 import sys
 
 from ..config import AppConfig
+from ..core import get_logger
+
+# The platform cannot change while the process runs
+_IS_LINUX = sys.platform.startswith('linux')
 
 
 def configure_ssl(config: AppConfig) -> None:
@@ -14,19 +18,18 @@ def configure_ssl(config: AppConfig) -> None:
         config (AppConfig): Configuration containing SSL settings.
 
     """
-    logger = config.logger
+    logger = get_logger()
 
-    if not sys.platform.startswith('linux'):
+    if not _IS_LINUX:
         logger.info('Skipping SSL configuration: is only applicable on Linux platforms')
         return
 
-    if config.ssl.key and config.ssl.cert:
-        if all([config.ssl.key.is_file(), config.ssl.cert.is_file()]):
-            logger.info('SSL enabled with key and cert files')
-            config.ssl.setup()
-        else:
-            logger.warning('SSL key or cert file not found, disabling SSL')
-            config.ssl.key = None
-            config.ssl.cert = None
-    else:
+    if not (config.ssl.key and config.ssl.cert):
         logger.info('SSL disabled - no key/cert configured')
+    elif config.ssl.key.is_file() and config.ssl.cert.is_file():
+        logger.info('SSL enabled with key and cert files')
+        config.ssl.setup(logger)
+    else:
+        logger.warning('SSL key or cert file not found, disabling SSL')
+        config.ssl.key = None
+        config.ssl.cert = None
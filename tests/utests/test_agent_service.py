@@ -0,0 +1,99 @@
+"""Unit tests for the Gemini agent service, without calling Gemini."""
+
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.models.test import TestModel
+
+from ule.artmentorai_project.config import AppConfig, GeminiConfig
+from ule.artmentorai_project.models import AnalysisResponse
+from ule.artmentorai_project.services import AgentService
+
+_ANALYSIS = {
+    'summary': 'Figure drawing with good proportions',
+    'score': 7,
+    'technical_errors': ['Inconsistent perspective'],
+    'constructive_advice': 'Practice perspective studies with guide lines.',
+}
+
+
+class _Agent:
+    """Agent answering with a fixed result, recording the prompts it receives."""
+
+    def __init__(self, data=None, error=None):
+        self.data = data
+        self.error = error
+        self.prompts = []
+
+    async def run(self, prompt):
+        self.prompts.append(prompt)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(data=self.data)
+
+
+def _service(agent):
+    config = AppConfig(gemini=GeminiConfig(api_key='test-key'))
+    service = AgentService(config, SimpleNamespace(model=TestModel()))
+    service.agent = agent
+    return service
+
+
+@pytest.mark.asyncio
+async def test_analyze_image_passes_the_image_view_without_copying():
+    agent = _Agent(data=AnalysisResponse(**_ANALYSIS))
+    image = memoryview(bytearray(b'\x89PNG' * 16))
+
+    result = await _service(agent).analyze_image(image, mime_type='image/png')
+
+    assert result.score == 7
+    [[_prompt, content]] = agent.prompts
+    assert content.data is image
+    assert content.media_type == 'image/png'
+
+
+@pytest.mark.asyncio
+async def test_analyze_image_allocates_no_copy_of_a_large_image():
+    service = _service(_Agent(data=AnalysisResponse(**_ANALYSIS)))
+    image = memoryview(bytearray(5 * 1024 * 1024))
+
+    tracemalloc.start()
+    try:
+        await service.analyze_image(image, mime_type='image/png')
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Nothing image-sized is allocated (e.g. a base64 encoding of the image)
+    assert peak < 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_analyze_image_accepts_a_dict_result():
+    result = await _service(_Agent(data=_ANALYSIS)).analyze_image(b'image')
+
+    assert isinstance(result, AnalysisResponse)
+    assert result.summary == _ANALYSIS['summary']
+
+
+@pytest.mark.asyncio
+async def test_analyze_image_uses_the_user_comments():
+    agent = _Agent(data=AnalysisResponse(**_ANALYSIS))
+
+    await _service(agent).analyze_image(b'image', user_text='Is the hand right?')
+
+    assert "'Is the hand right?'" in agent.prompts[0][0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'error',
+    [UnexpectedModelBehavior('not an analysis'), RuntimeError('connection lost')],
+)
+async def test_analyze_image_errors_are_raised_as_value_errors(error):
+    with pytest.raises(ValueError, match='Gemini image analysis error') as raised:
+        await _service(_Agent(error=error)).analyze_image(b'image')
+
+    assert raised.value.__cause__ is error
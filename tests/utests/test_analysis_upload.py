@@ -0,0 +1,149 @@
+"""Unit tests for upload validation and reading in the analysis endpoints."""
+
+import asyncio
+import hashlib
+import io
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from ule.artmentorai_project.config import UploadConfig
+from ule.artmentorai_project.endpoints.analysis import (
+    _acquire_buffer,
+    _create_buffer_pool,
+    _read_upload,
+    _RecentAnalyses,
+    _validate_image_file,
+)
+
+
+@pytest.fixture
+def config():
+    return SimpleNamespace(upload=UploadConfig())
+
+
+def _upload(data: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename='art.png')
+
+
+@pytest.mark.asyncio
+async def test_read_upload_fills_buffer_and_hashes_content():
+    data = b'x' * 3000
+    buffer = bytearray(4096)
+
+    size, digest = await _read_upload(_upload(data), buffer, 'too large')
+
+    assert size == len(data)
+    assert buffer[:size] == data
+    assert digest == hashlib.blake2b(data, digest_size=16).digest()
+
+
+@pytest.mark.asyncio
+async def test_read_upload_accepts_a_file_filling_the_buffer():
+    size, _ = await _read_upload(_upload(b'x' * 16), bytearray(16), 'too large')
+
+    assert size == 16
+
+
+@pytest.mark.asyncio
+async def test_read_upload_rejects_file_larger_than_buffer():
+    with pytest.raises(HTTPException) as error:
+        await _read_upload(_upload(b'x' * 17), bytearray(16), 'too large')
+
+    assert error.value.status_code == 413
+    assert error.value.detail == 'too large'
+
+
+@pytest.mark.asyncio
+async def test_read_upload_rejects_empty_file():
+    with pytest.raises(HTTPException) as error:
+        await _read_upload(_upload(b''), bytearray(16), 'too large')
+
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_acquire_buffer_returns_free_buffer():
+    pool = _create_buffer_pool(2, 8)
+
+    buffer = await _acquire_buffer(pool, 1.0)
+
+    assert len(buffer) == 8
+    assert pool.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_buffer_answers_503_when_pool_stays_empty():
+    pool: asyncio.Queue[bytearray] = asyncio.Queue()
+
+    with pytest.raises(HTTPException) as error:
+        await _acquire_buffer(pool, 0.01)
+
+    assert error.value.status_code == 503
+
+
+@pytest.mark.parametrize(
+    ('filename', 'content_type', 'expected'),
+    [
+        ('art.png', 'image/png', ('.png', 'image/png')),
+        ('ART.JPG', 'image/jpeg', ('.jpg', 'image/jpeg')),
+        ('art.webp', None, ('.webp', 'image/webp')),
+        ('art.jpeg', '', ('.jpeg', 'image/jpeg')),
+    ],
+)
+def test_validate_image_file_accepts_matching_types(config, filename, content_type, expected):
+    assert _validate_image_file(filename, content_type, config) == expected
+
+
+@pytest.mark.parametrize(
+    ('filename', 'content_type'),
+    [
+        ('art.txt', 'text/plain'),
+        ('art', 'image/png'),
+        ('art.png', 'image/jpeg'),
+        ('art.png.exe', 'image/png'),
+    ],
+)
+def test_validate_image_file_rejects_other_types(config, filename, content_type):
+    with pytest.raises(HTTPException) as error:
+        _validate_image_file(filename, content_type, config)
+
+    assert error.value.status_code == 400
+    assert error.value.detail == config.upload.file_type_error
+
+
+def test_mime_types_by_extension_only_keeps_allowed_types():
+    upload = UploadConfig(
+        allowed_extensions=['.png', '.bmp'],
+        allowed_mime_types=['image/png'],
+    )
+
+    assert upload.mime_types_by_extension == {'.png': ('image/png',)}
+
+
+def test_recent_analyses_evicts_least_recently_used():
+    recent = _RecentAnalyses(2)
+    first, second, third = (
+        (b'1', 'image/png', None),
+        (b'2', 'image/png', None),
+        (b'3', 'image/png', None),
+    )
+    recent.put(first, 'a')
+    recent.put(second, 'b')
+
+    # Reading the first entry makes the second one the least recently used
+    assert recent.get(first) == 'a'
+    recent.put(third, 'c')
+
+    assert recent.get(second) is None
+    assert recent.get(first) == 'a'
+    assert recent.get(third) == 'c'
+
+
+def test_recent_analyses_key_includes_mime_type_and_comments():
+    recent = _RecentAnalyses(4)
+    recent.put((b'1', 'image/png', None), 'a')
+
+    assert recent.get((b'1', 'image/jpeg', None)) is None
+    assert recent.get((b'1', 'image/png', 'comments')) is None
@@ -0,0 +1,168 @@
+"""Unit tests for the command-line interface."""
+
+import sys
+
+import pytest
+
+from ule.artmentorai_project import cli, services
+from ule.artmentorai_project.config import AppConfig, GeminiConfig
+
+
+def _parse(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['artmentor', *argv])
+    return cli._parse_args()
+
+
+def test_parse_args_defaults(monkeypatch):
+    args = _parse(monkeypatch)
+
+    assert not args.dev
+    assert not args.verbose
+    assert not args.help
+    assert args.workers is None
+    assert args.unknown == []
+
+
+@pytest.mark.parametrize('flag', ['-h', '--help'])
+def test_parse_args_help(monkeypatch, flag):
+    assert _parse(monkeypatch, flag).help
+
+
+def test_parse_args_flags(monkeypatch):
+    args = _parse(monkeypatch, '--verbose', '--dev')
+
+    assert args.dev
+    assert args.verbose
+
+
+def test_parse_args_reports_unknown_arguments(monkeypatch):
+    assert _parse(monkeypatch, '--port', '80').unknown == ['--port', '80']
+
+
+def test_main_prints_help(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['artmentor', '--help'])
+
+    assert cli.main() == 0
+    assert capsys.readouterr().out == cli._HELP
+
+
+def test_main_exits_with_usage_error_on_unknown_arguments(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['artmentor', '--port', '80'])
+
+    assert cli.main() == 2
+    assert 'unrecognized arguments: --port 80' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argv', [('--workers', '3'), ('--workers=3',)])
+def test_parse_args_workers(monkeypatch, argv):
+    assert _parse(monkeypatch, *argv).workers == 3
+
+
+@pytest.mark.parametrize(
+    ('argv', 'unknown'),
+    [
+        (('--workers',), ['--workers']),
+        (('--workers', '0'), ['--workers 0']),
+        (('--workers=-1',), ['--workers -1']),
+        (('--workers', '²'), ['--workers ²']),
+    ],
+)
+def test_parse_args_rejects_invalid_workers(monkeypatch, argv, unknown):
+    args = _parse(monkeypatch, *argv)
+
+    assert args.workers is None
+    assert args.unknown == unknown
+
+
+def test_main_exits_with_usage_error_on_invalid_workers(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['artmentor', '--workers', '²'])
+
+    assert cli.main() == 2
+    assert 'unrecognized arguments: --workers ²' in capsys.readouterr().err
+
+
+class _Gemini:
+    model = None
+
+    def __init__(self, events, fail_warmup=False):
+        self.events = events
+        self.fail_warmup = fail_warmup
+
+    async def warmup(self):
+        self.events.append('gemini.warmup')
+        if self.fail_warmup:
+            msg = 'warm-up failed'
+            raise RuntimeError(msg)
+
+    async def aclose(self):
+        self.events.append('gemini.aclose')
+
+
+class _VectorService:
+    def __init__(self, events, fail_start=False):
+        self.events = events
+        self.fail_start = fail_start
+
+    async def start(self):
+        self.events.append('vector.start')
+        if self.fail_start:
+            msg = 'Qdrant unreachable'
+            raise RuntimeError(msg)
+
+    async def stop(self):
+        self.events.append('vector.stop')
+
+    async def close(self):
+        self.events.append('vector.close')
+
+
+def _lifespan_app(monkeypatch, events, fail_start=False, fail_warmup=False):
+    # The lifespan builds its clients from the services package: replace them
+    monkeypatch.setattr(
+        services,
+        'build_gemini_client',
+        lambda *_args: _Gemini(events, fail_warmup),
+    )
+    monkeypatch.setattr(services, 'AgentService', lambda *_args: object())
+    monkeypatch.setattr(
+        services,
+        'VectorService',
+        lambda **_kwargs: _VectorService(events, fail_start),
+    )
+    return cli.create_app(AppConfig(gemini=GeminiConfig(api_key='test-key')))
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_and_cleans_up_in_reverse_order(monkeypatch):
+    events = []
+    app = _lifespan_app(monkeypatch, events)
+
+    async with app.router.lifespan_context(app):
+        assert events == ['vector.start', 'gemini.warmup']
+        assert isinstance(app.state.vector_service, _VectorService)
+
+    assert events[2:] == ['vector.stop', 'vector.close', 'gemini.aclose']
+
+
+@pytest.mark.asyncio
+async def test_lifespan_cleans_up_when_vector_service_fails_to_start(monkeypatch):
+    events = []
+    app = _lifespan_app(monkeypatch, events, fail_start=True)
+
+    with pytest.raises(RuntimeError, match='Qdrant unreachable'):
+        async with app.router.lifespan_context(app):
+            pytest.fail('the application must not be served')
+
+    assert events == ['vector.start', 'vector.stop', 'vector.close', 'gemini.aclose']
+
+
+@pytest.mark.asyncio
+async def test_lifespan_cleans_up_when_warmup_fails(monkeypatch):
+    events = []
+    app = _lifespan_app(monkeypatch, events, fail_warmup=True)
+
+    with pytest.raises(RuntimeError, match='warm-up failed'):
+        async with app.router.lifespan_context(app):
+            pytest.fail('the application must not be served')
+
+    assert events[2:] == ['vector.stop', 'vector.close', 'gemini.aclose']
@@ -0,0 +1,56 @@
+"""Unit tests for the shared Gemini HTTP client."""
+
+import httpx
+import pytest
+
+from ule.artmentorai_project.config import GeminiConfig
+from ule.artmentorai_project.services import GeminiClient
+
+
+def _client(handler):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return GeminiClient(GeminiConfig(api_key='test-key'), http_client)
+
+
+@pytest.mark.asyncio
+async def test_warmup_lists_one_model_with_the_api_key():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'models': []})
+
+    client = _client(handler)
+    await client.warmup()
+
+    [request] = requests
+    assert request.method == 'GET'
+    assert request.url.path.endswith('/models')
+    assert request.url.params['pageSize'] == '1'
+    assert request.headers['x-goog-api-key'] == 'test-key'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('status_code', [401, 503])
+async def test_warmup_failures_are_not_raised(status_code):
+    client = _client(lambda _request: httpx.Response(status_code))
+
+    await client.warmup()
+
+
+@pytest.mark.asyncio
+async def test_warmup_connection_errors_are_not_raised():
+    def handler(request):
+        msg = 'unreachable'
+        raise httpx.ConnectError(msg, request=request)
+
+    await _client(handler).warmup()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_the_connection_pool():
+    client = _client(lambda _request: httpx.Response(200))
+
+    await client.aclose()
+
+    assert client.http_client.is_closed
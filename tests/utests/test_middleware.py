@@ -0,0 +1,172 @@
+"""Unit tests for the pure ASGI middleware."""
+
+import json
+
+import pytest
+
+from ule.artmentorai_project.core import ContentLengthLimit, FastCORS, HTTPSRedirect
+
+
+class _App:
+    """ASGI application answering 200 and recording whether it was called."""
+
+    def __init__(self) -> None:
+        self.called = False
+
+    async def __call__(self, _scope, _receive, send) -> None:
+        self.called = True
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'ok'})
+
+
+def _scope(method='GET', path='/', headers=(), scheme='http', query_string=b''):
+    return {
+        'type': 'http',
+        'method': method,
+        'scheme': scheme,
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query_string,
+        'server': ('testserver', 80),
+        'headers': [(name.encode(), value.encode()) for name, value in headers],
+    }
+
+
+async def _call(middleware, scope):
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages
+
+
+def _headers(messages):
+    return dict(messages[0]['headers'])
+
+
+@pytest.mark.asyncio
+async def test_cors_without_origin_passes_through():
+    app = _App()
+    messages = await _call(FastCORS(app, frozenset({b'https://a.test'})), _scope())
+
+    assert app.called
+    assert b'access-control-allow-origin' not in _headers(messages)
+
+
+@pytest.mark.asyncio
+async def test_cors_allowed_origin_is_echoed():
+    app = _App()
+    middleware = FastCORS(app, frozenset({b'https://a.test'}))
+    messages = await _call(middleware, _scope(headers=[('origin', 'https://a.test')]))
+
+    headers = _headers(messages)
+    assert headers[b'access-control-allow-origin'] == b'https://a.test'
+    assert headers[b'access-control-allow-credentials'] == b'true'
+    assert headers[b'vary'] == b'Origin'
+
+
+@pytest.mark.asyncio
+async def test_cors_disallowed_origin_gets_no_cors_headers():
+    app = _App()
+    middleware = FastCORS(app, frozenset({b'https://a.test'}))
+    messages = await _call(middleware, _scope(headers=[('origin', 'https://b.test')]))
+
+    assert app.called
+    assert b'access-control-allow-origin' not in _headers(messages)
+
+
+@pytest.mark.asyncio
+async def test_cors_wildcard_allows_any_origin():
+    middleware = FastCORS(_App(), frozenset({b'*'}))
+    messages = await _call(middleware, _scope(headers=[('origin', 'https://b.test')]))
+
+    assert _headers(messages)[b'access-control-allow-origin'] == b'https://b.test'
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_is_answered_without_the_app():
+    app = _App()
+    middleware = FastCORS(app, frozenset({b'https://a.test'}))
+    scope = _scope(
+        method='OPTIONS',
+        headers=[
+            ('origin', 'https://a.test'),
+            ('access-control-request-method', 'POST'),
+            ('access-control-request-headers', 'x-custom'),
+        ],
+    )
+    messages = await _call(middleware, scope)
+
+    assert not app.called
+    assert messages[0]['status'] == 204
+    headers = _headers(messages)
+    assert headers[b'access-control-allow-origin'] == b'https://a.test'
+    assert headers[b'access-control-allow-headers'] == b'x-custom'
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_from_disallowed_origin_is_rejected():
+    app = _App()
+    middleware = FastCORS(app, frozenset({b'https://a.test'}))
+    scope = _scope(
+        method='OPTIONS',
+        headers=[('origin', 'https://b.test'), ('access-control-request-method', 'POST')],
+    )
+    messages = await _call(middleware, scope)
+
+    assert not app.called
+    assert messages[0]['status'] == 400
+    assert messages[1]['body'] == b'Disallowed CORS origin'
+
+
+@pytest.mark.asyncio
+async def test_https_redirect_keeps_path_and_query():
+    app = _App()
+    scope = _scope(path='/analysis/health', headers=[('host', 'a.test:80')], query_string=b'x=1')
+    messages = await _call(HTTPSRedirect(app), scope)
+
+    assert not app.called
+    assert messages[0]['status'] == 307
+    assert _headers(messages)[b'location'] == b'https://a.test/analysis/health?x=1'
+
+
+@pytest.mark.asyncio
+async def test_https_redirect_uses_server_address_without_host_header():
+    messages = await _call(HTTPSRedirect(_App()), _scope(path='/'))
+
+    assert _headers(messages)[b'location'] == b'https://testserver/'
+
+
+@pytest.mark.asyncio
+async def test_https_requests_are_not_redirected():
+    app = _App()
+    await _call(HTTPSRedirect(app), _scope(scheme='https'))
+
+    assert app.called
+
+
+@pytest.mark.asyncio
+async def test_content_length_over_limit_is_rejected():
+    app = _App()
+    middleware = ContentLengthLimit(app, max_body_size=10, detail='File too large')
+    messages = await _call(middleware, _scope(method='POST', headers=[('content-length', '11')]))
+
+    assert not app.called
+    assert messages[0]['status'] == 413
+    assert json.loads(messages[1]['body']) == {'detail': 'File too large'}
+    assert _headers(messages)[b'content-length'] == str(len(messages[1]['body'])).encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('headers', [[('content-length', '10')], [], [('content-length', 'x')]])
+async def test_content_length_within_limit_or_missing_passes_through(headers):
+    app = _App()
+    middleware = ContentLengthLimit(app, max_body_size=10, detail='File too large')
+    await _call(middleware, _scope(method='POST', headers=headers))
+
+    assert app.called
@@ -0,0 +1,170 @@
+"""Unit tests for the vector service that do not need a Qdrant server."""
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from ule.artmentorai_project.services.vector_service import ArtCritique, VectorService
+
+
+class _Model:
+    """Embedding model returning the text length as vector, recording the texts it embeds."""
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.batch_size = None
+
+    def embed(self, texts, batch_size):
+        self.calls.append(list(texts))
+        self.batch_size = batch_size
+        return (np.array([len(text), 1.0], dtype=np.float32) for text in texts)
+
+
+class _Client:
+    """Qdrant client recording upserted points."""
+
+    def __init__(self) -> None:
+        self.upserts = []
+        self.exists_calls = 0
+
+    async def upsert(self, **kwargs):
+        self.upserts.append(kwargs['points'])
+
+    async def collection_exists(self, _collection_name):
+        self.exists_calls += 1
+        return True
+
+
+@pytest.fixture
+def service():
+    # Only the attributes used by the methods under test: no Qdrant client is created
+    service = object.__new__(VectorService)
+    service.logger = logging.getLogger(__name__)
+    service.embedding_model = _Model()
+    service.client = _Client()
+    service._embedding_cache = OrderedDict()
+    service._pending = asyncio.Queue(maxsize=1)
+    service._requests = asyncio.Semaphore(VectorService.MAX_CONCURRENT_REQUESTS)
+    service._healthy_until = 0.0
+    return service
+
+
+def _critique(summary='Strong composition'):
+    return ArtCritique(
+        summary=summary,
+        score=7,
+        technical_errors=['Muddy shadows'],
+        constructive_advice='Use complementary colors',
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_drops_critiques_when_queue_is_full(service):
+    service.enqueue(_critique(), 'first.png')
+    service.enqueue(_critique(), 'second.png')
+
+    assert service._pending.qsize() == 1
+    assert service._pending.get_nowait()[1] == 'first.png'
+
+
+@pytest.mark.asyncio
+async def test_embed_only_embeds_uncached_texts(service):
+    await service._embed(['a', 'bb'])
+
+    vectors = await service._embed(['bb', 'ccc', 'a'])
+
+    assert vectors == [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+    assert service.embedding_model.calls[1] == ['ccc']
+
+
+@pytest.mark.asyncio
+async def test_embed_skips_model_when_all_texts_are_cached(service):
+    await service._embed(['a'])
+    await service._embed(['a', 'a'])
+
+    assert len(service.embedding_model.calls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('processes', [0, -1])
+async def test_bulk_ingest_rejects_invalid_process_count(service, processes):
+    with pytest.raises(ValueError, match='processes'):
+        await service.bulk_ingest([_critique()], ['art.png'], processes=processes)
+
+
+def test_build_point_id_is_stable_per_filename():
+    point = VectorService._build_point(_critique(), 'art.png', [0.0, 1.0])
+    again = VectorService._build_point(_critique(), 'art.png', [1.0, 0.0])
+    other = VectorService._build_point(_critique(), 'other.png', [0.0, 1.0])
+
+    assert point.id == again.id == str(uuid.uuid5(uuid.NAMESPACE_URL, 'art.png'))
+    assert point.id != other.id
+    assert point.payload['advice'] == 'Use complementary colors'
+
+
+@pytest.mark.asyncio
+async def test_embed_keeps_input_order(service):
+    vectors = await service._embed(['ccc', 'a', 'bb'])
+
+    assert vectors == [[3.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+    # Texts are embedded sorted by length, to limit padding
+    assert service.embedding_model.calls == [['a', 'bb', 'ccc']]
+    assert service.embedding_model.batch_size == VectorService.EMBEDDING_BATCH_SIZE
+
+
+@pytest.mark.parametrize('technical_errors', [('tuple',), ['text', 1]])
+def test_critique_rejects_invalid_technical_errors(technical_errors):
+    with pytest.raises(TypeError):
+        ArtCritique(
+            summary='s', score=5, technical_errors=technical_errors, constructive_advice='a'
+        )
+
+
+def test_critique_embedding_text_joins_summary_and_errors():
+    assert _critique().get_text_for_embedding() == 'Strong composition Muddy shadows'
+
+
+def test_critique_embedding_text_is_truncated():
+    critique = ArtCritique(
+        summary='x' * 600, score=5, technical_errors=[], constructive_advice='advice'
+    )
+
+    assert critique.get_text_for_embedding() == 'x' * 512
+
+
+@pytest.mark.asyncio
+async def test_health_check_reuses_a_recent_healthy_result(service):
+    assert await service.health_check()
+    assert await service.health_check()
+
+    assert service.client.exists_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_save_critiques_pipelined_upserts_every_batch_in_order(service):
+    filenames = [f'art-{index}.png' for index in range(70)]
+
+    point_ids = await service.save_critiques_pipelined(
+        (_critique(f'summary {index}'), filename) for index, filename in enumerate(filenames)
+    )
+
+    assert point_ids == [str(uuid.uuid5(uuid.NAMESPACE_URL, name)) for name in filenames]
+    assert [len(points) for points in service.client.upserts] == [32, 32, 6]
+
+
+@pytest.mark.asyncio
+async def test_save_critiques_pipelined_raises_embedding_errors(service):
+    def embed(*_args, **_kwargs):
+        msg = 'model crashed'
+        raise RuntimeError(msg)
+
+    service.embedding_model.embed = embed
+
+    with pytest.raises(RuntimeError, match='save_critiques_pipelined'):
+        await service.save_critiques_pipelined([(_critique(), 'art.png')])
+
+    assert service.client.upserts == []